@@ -7,6 +7,7 @@ import numpy as np
 
 from src.agents import MarkovQAgent
 from src.game import Game2048
+from src.game.batch_2048 import run_random_episodes
 from src.ui import PygameUI
 
 
@@ -18,13 +19,18 @@ def board_to_observation(board: np.ndarray) -> np.ndarray:
     return observation
 
 
-def valid_actions_for_board(board: np.ndarray) -> list[int]:
-    """Compute valid actions directly from a board snapshot."""
+def game_for_board(board: np.ndarray) -> Game2048:
+    """Build a game positioned at a board snapshot."""
     game = Game2048(size=board.shape[0])
-    game.board = board.copy()
+    game.board = board
     game.score = 0
     game.max_tile = int(np.max(board)) if board.size else 0
-    return game.get_valid_actions()
+    return game
+
+
+def valid_actions_for_board(board: np.ndarray) -> list[int]:
+    """Compute valid actions directly from a board snapshot."""
+    return game_for_board(board).get_valid_actions()
 
 
 def random_agent(board: np.ndarray) -> int:
@@ -37,8 +43,14 @@ def random_agent(board: np.ndarray) -> int:
     Returns:
         Random valid action
     """
-    valid_actions = valid_actions_for_board(board)
-    return int(np.random.choice(valid_actions))
+    mask = game_for_board(board).valid_actions_mask()
+    if not mask:
+        raise ValueError("No valid actions on this board")
+    # Rejection sampling; at least one of the four actions is valid
+    while True:
+        action = int(np.random.randint(4))
+        if (mask >> action) & 1:
+            return action
 
 
 def load_markov_agent(model_path: str) -> MarkovQAgent:
@@ -94,7 +106,23 @@ def main():
     scores = []
     max_tiles = []
 
-    for episode in range(args.n_episodes):
+    if get_action is random_agent and not args.visualize:
+        # Headless random baseline: every episode runs in one parallel compiled call
+        if args.seed is not None:
+            seeds = args.seed + np.arange(args.n_episodes)
+        else:
+            seeds = np.random.default_rng().integers(2**32, size=args.n_episodes)
+        episode_scores, episode_max_tiles, episode_steps = run_random_episodes(seeds)
+        for episode in range(args.n_episodes):
+            print(f"\nEpisode {episode + 1}/{args.n_episodes}")
+            print(
+                f"Score: {episode_scores[episode]}, Max Tile: {episode_max_tiles[episode]}, "
+                f"Steps: {episode_steps[episode]}"
+            )
+        scores = episode_scores.tolist()
+        max_tiles = episode_max_tiles.tolist()
+
+    for episode in range(len(scores), args.n_episodes):
         print(f"\nEpisode {episode + 1}/{args.n_episodes}")
 
         # Create game
@@ -111,7 +139,7 @@ def main():
             steps = 0
 
             while not done:
-                action = get_action(game.board.copy())
+                action = get_action(game.board)
                 board, reward, done = game.step(action)
                 steps += 1
 
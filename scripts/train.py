@@ -120,6 +120,7 @@ def train(
         save_best=True,
         mode="max",
         verbose=True,
+        async_save=True,
     )
 
     config = {
@@ -139,7 +140,7 @@ def train(
 
     logger = MLFlowLogger(experiment_name=experiment_name, run_name=f"markov_q_{n_episodes}ep")
 
-    with logger:
+    with logger, checkpoint_manager:
         logger.log_params(config)
 
         best_eval_score = float("-inf")
@@ -0,0 +1,29 @@
+"""Build the optional Cython grid kernels (``src/game/_kernels_c.pyx``).
+
+Project metadata lives in pyproject.toml. The extension is optional: when
+Cython or a C compiler is unavailable the package installs without it and
+Game2048 falls back to the Numba/pure-Python kernels.
+"""
+
+from setuptools import Extension, find_packages, setup
+
+try:
+    import numpy as np
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "src.game._kernels_c",
+                ["src/game/_kernels_c.pyx"],
+                include_dirs=[np.get_include()],
+                optional=True,
+            )
+        ],
+        compiler_directives={"language_level": "3"},
+    )
+
+# The importable package is ``src`` itself, not a src-layout project root
+setup(packages=find_packages(include=["src", "src.*"]), ext_modules=ext_modules)
@@ -249,8 +249,16 @@ class FeatureQAgent:
         torch.save(self.state_dict(), path)
 
     def load(self, path: str):
-        """Load the agent state from a direct save or checkpoint file."""
-        payload = torch.load(path, map_location="cpu")
+        """
+        Load the agent state from a direct save or checkpoint file.
+
+        Checkpoint files are read with ``load_checkpoint``, so sharded, delta
+        and deduplicated ``ModelCheckpoint`` files load like plain ones.
+        """
+        # Imported here so importing the agent does not pull in MLflow
+        from ..utils.checkpoint import load_checkpoint
+
+        payload = load_checkpoint(path)
         state_dict = payload.get("model_state_dict", payload)
         self.load_state_dict(state_dict)
 
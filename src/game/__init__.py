@@ -1,5 +1,6 @@
 """Core 2048 game implementation."""
 
+from .batch_2048 import BatchGame2048
 from .game_2048 import Action, Game2048
 
-__all__ = ["Game2048", "Action"]
+__all__ = ["Game2048", "BatchGame2048", "Action"]
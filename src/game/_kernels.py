@@ -0,0 +1,195 @@
+"""Compiled move kernels for the NumPy grid backend of Game2048.
+
+The kernels operate on contiguous ``(n, n) int8`` boards of log2 tile ranks
+(0 = empty, 1 = a 2 tile, ...) and are JIT-compiled with Numba when it is
+installed (``pip install rl-2048[fast]``). Without Numba they run as plain
+Python with identical results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def _slide(board: np.ndarray, vertical: bool, reverse: bool) -> Tuple[np.ndarray, int]:
+    """
+    Slide and merge every row (or column) of a board.
+
+    Lines are read and written in place by index, so columns are merged
+    without transposed views or contiguity copies.
+
+    Args:
+        board: Board of log2 tile ranks
+        vertical: Merge columns instead of rows
+        reverse: Merge towards the last index (right/down) instead of the first
+
+    Returns:
+        Tuple of (new_board, score_gained)
+    """
+    n_rows, n_cols = board.shape
+    n_lines = n_cols if vertical else n_rows
+    length = n_rows if vertical else n_cols
+    moved = np.zeros((n_rows, n_cols), dtype=np.int8)
+    score = 0
+    for line in range(n_lines):
+        k = 0
+        previous = 0
+        for step in range(length):
+            pos = length - 1 - step if reverse else step
+            value = int(board[pos, line] if vertical else board[line, pos])
+            if value == 0:
+                continue
+            if value == previous:
+                target = k - 1
+                value += 1
+                score += 1 << value
+                previous = 0
+            else:
+                target = k
+                k += 1
+                previous = value
+            out = length - 1 - target if reverse else target
+            if vertical:
+                moved[out, line] = value
+            else:
+                moved[line, out] = value
+    return moved, score
+
+
+@njit(cache=True, fastmath=True)
+def move_left(board: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Move tiles left, returning (new_board, score_gained)."""
+    return _slide(board, False, False)
+
+
+@njit(cache=True, fastmath=True)
+def move_right(board: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Move tiles right, returning (new_board, score_gained)."""
+    return _slide(board, False, True)
+
+
+@njit(cache=True, fastmath=True)
+def move_up(board: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Move tiles up, returning (new_board, score_gained)."""
+    return _slide(board, True, False)
+
+
+@njit(cache=True, fastmath=True)
+def move_down(board: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Move tiles down, returning (new_board, score_gained)."""
+    return _slide(board, True, True)
+
+
+@njit(cache=True, fastmath=True)
+def would_change(board: np.ndarray, action: int) -> bool:
+    """
+    Check whether an action changes the board, without mutating it.
+
+    Args:
+        board: Board of log2 tile ranks
+        action: Action to check (0=UP, 1=RIGHT, 2=DOWN, 3=LEFT)
+
+    Returns:
+        True if the move would change the board
+    """
+    if action == 0:
+        moved, _ = move_up(board)
+    elif action == 1:
+        moved, _ = move_right(board)
+    elif action == 2:
+        moved, _ = move_down(board)
+    else:
+        moved, _ = move_left(board)
+    return np.any(moved != board)
+
+
+@njit(cache=True, fastmath=True)
+def is_game_over(board: np.ndarray) -> bool:
+    """Return True if the board has no empty cell and no mergeable neighbours."""
+    rows, cols = board.shape
+    for i in range(rows):
+        for j in range(cols):
+            current = board[i, j]
+            if current == 0:
+                return False
+            if j < cols - 1 and board[i, j + 1] == current:
+                return False
+            if i < rows - 1 and board[i + 1, j] == current:
+                return False
+    return True
+
+
+@njit(cache=True, fastmath=True)
+def add_random_tile(board: np.ndarray, draw: float) -> int:
+    """
+    Place a 2 (90%) or 4 (10%) on a random empty cell in place.
+
+    A single uniform draw picks both: its integer part (scaled by the number
+    of empty cells) selects the cell and its fractional part the value.
+
+    Args:
+        board: Board to modify
+        draw: Uniform draw in [0, 1)
+
+    Returns:
+        Rank of the placed tile (1 for a 2, 2 for a 4), or 0 if the board is full
+    """
+    flat = board.ravel()
+    n_empty = 0
+    for k in range(flat.shape[0]):
+        if flat[k] == 0:
+            n_empty += 1
+    if n_empty == 0:
+        return 0
+
+    position = draw * n_empty
+    target = int(position)
+    rank = 1 if position - target < 0.9 else 2
+    for k in range(flat.shape[0]):
+        if flat[k] == 0:
+            if target == 0:
+                flat[k] = rank
+                return rank
+            target -= 1
+    return 0
+
+
+# Indexed by Action value
+MOVES = (move_up, move_right, move_down, move_left)
+
+
+_warmed_up = False
+
+
+def warm_up():
+    """
+    Compile every kernel once so the first game step pays no JIT cost.
+
+    Called when the first NumPy-backend game is created rather than at
+    import, since the default bitboard backend never uses these kernels.
+    """
+    global _warmed_up
+    if _warmed_up:
+        return
+    board = np.zeros((4, 4), dtype=np.int8)
+    for move in MOVES:
+        move(board)
+    would_change(board, 0)
+    is_game_over(board)
+    add_random_tile(board, 0.0)
+    _warmed_up = True
@@ -0,0 +1,160 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Ahead-of-time compiled grid kernels for Game2048.
+
+Cython build of ``_kernels.py`` with the same function signatures, for users
+who want compiled moves without installing Numba or paying JIT latency at
+startup. Build in place with::
+
+    python setup.py build_ext --inplace
+
+``Game2048`` prefers this module when it is importable, then falls back to
+``_kernels`` (Numba-compiled if available, plain Python otherwise).
+"""
+
+import numpy as np
+
+
+cdef long long _slide(const signed char[:, :] board, signed char[:, ::1] moved, bint vertical,
+                      bint reverse):
+    """Slide and merge every row (or column) of ``board`` into ``moved``."""
+    cdef Py_ssize_t n_lines = board.shape[1] if vertical else board.shape[0]
+    cdef Py_ssize_t length = board.shape[0] if vertical else board.shape[1]
+    cdef Py_ssize_t line, step, pos, k, target, out
+    cdef int value, previous
+    cdef long long score = 0
+
+    for line in range(n_lines):
+        k = 0
+        previous = 0
+        for step in range(length):
+            pos = length - 1 - step if reverse else step
+            value = board[pos, line] if vertical else board[line, pos]
+            if value == 0:
+                continue
+            if value == previous:
+                target = k - 1
+                value += 1
+                score += (<long long>1) << value
+                previous = 0
+            else:
+                target = k
+                k += 1
+                previous = value
+            out = length - 1 - target if reverse else target
+            if vertical:
+                moved[out, line] = value
+            else:
+                moved[line, out] = value
+    return score
+
+
+cdef tuple _move(const signed char[:, :] board, bint vertical, bint reverse):
+    """Allocate the output board and slide into it."""
+    moved = np.zeros((board.shape[0], board.shape[1]), dtype=np.int8)
+    score = _slide(board, moved, vertical, reverse)
+    return moved, score
+
+
+cpdef tuple move_left(const signed char[:, :] board):
+    """Move tiles left, returning (new_board, score_gained)."""
+    return _move(board, False, False)
+
+
+cpdef tuple move_right(const signed char[:, :] board):
+    """Move tiles right, returning (new_board, score_gained)."""
+    return _move(board, False, True)
+
+
+cpdef tuple move_up(const signed char[:, :] board):
+    """Move tiles up, returning (new_board, score_gained)."""
+    return _move(board, True, False)
+
+
+cpdef tuple move_down(const signed char[:, :] board):
+    """Move tiles down, returning (new_board, score_gained)."""
+    return _move(board, True, True)
+
+
+cpdef bint would_change(const signed char[:, :] board, int action):
+    """
+    Check whether an action changes the board, without mutating it.
+
+    Args:
+        board: Board of log2 tile ranks
+        action: Action to check (0=UP, 1=RIGHT, 2=DOWN, 3=LEFT)
+
+    Returns:
+        True if the move would change the board
+    """
+    cdef Py_ssize_t i, j
+    cdef signed char[:, ::1] moved = np.zeros((board.shape[0], board.shape[1]), dtype=np.int8)
+    _slide(board, moved, action == 0 or action == 2, action == 1 or action == 2)
+    for i in range(board.shape[0]):
+        for j in range(board.shape[1]):
+            if moved[i, j] != board[i, j]:
+                return True
+    return False
+
+
+cpdef bint is_game_over(const signed char[:, :] board):
+    """Return True if the board has no empty cell and no mergeable neighbours."""
+    cdef Py_ssize_t rows = board.shape[0]
+    cdef Py_ssize_t cols = board.shape[1]
+    cdef Py_ssize_t i, j
+    cdef int current
+
+    for i in range(rows):
+        for j in range(cols):
+            current = board[i, j]
+            if current == 0:
+                return False
+            if j < cols - 1 and board[i, j + 1] == current:
+                return False
+            if i < rows - 1 and board[i + 1, j] == current:
+                return False
+    return True
+
+
+cpdef int add_random_tile(signed char[:, ::1] board, double draw):
+    """
+    Place a 2 (90%) or 4 (10%) on a random empty cell in place.
+
+    Args:
+        board: Board to modify
+        draw: Uniform draw in [0, 1)
+
+    Returns:
+        Rank of the placed tile (1 for a 2, 2 for a 4), or 0 if the board is full
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n_empty = 0
+    cdef Py_ssize_t target
+    cdef double position
+    cdef signed char rank
+
+    for i in range(board.shape[0]):
+        for j in range(board.shape[1]):
+            if board[i, j] == 0:
+                n_empty += 1
+    if n_empty == 0:
+        return 0
+
+    position = draw * n_empty
+    target = <Py_ssize_t>position
+    rank = 1 if position - target < 0.9 else 2
+    for i in range(board.shape[0]):
+        for j in range(board.shape[1]):
+            if board[i, j] == 0:
+                if target == 0:
+                    board[i, j] = rank
+                    return rank
+                target -= 1
+    return 0
+
+
+# Indexed by Action value
+MOVES = (move_up, move_right, move_down, move_left)
+
+
+def warm_up():
+    """No-op: the Cython kernels are compiled ahead of time."""
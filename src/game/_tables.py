@@ -0,0 +1,90 @@
+"""Row lookup tables for the 4x4 bitboard.
+
+A bitboard row is four 4-bit log2 ranks, so there are only 65536 distinct
+rows. Every row move is precomputed here once at import, vectorized over all
+rows with NumPy, and a full board move becomes four table lookups.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Largest rank a nibble can hold; two rank-15 (32768) tiles do not merge.
+MAX_RANK = 15
+
+ROWS = np.arange(65536, dtype=np.uint32)
+
+
+def reverse_rows(rows: np.ndarray) -> np.ndarray:
+    """Reverse the order of the four nibbles in each 16-bit row."""
+    return (
+        ((rows & 0xF000) >> 12)
+        | ((rows & 0x0F00) >> 4)
+        | ((rows & 0x00F0) << 4)
+        | ((rows & 0x000F) << 12)
+    )
+
+
+def _merge_rows_left(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge every row to the left, one column at a time across all rows.
+
+    Each tile either merges into the last placed tile (if equal and not yet
+    merged this move) or is placed at the next free slot, which is exactly
+    ``Game2048._merge_line`` on rank-encoded cells.
+
+    Args:
+        rows: 16-bit rows of log2 ranks
+
+    Returns:
+        Tuple of (merged rows, score gained per row)
+    """
+    n = rows.shape[0]
+    index = np.arange(n)
+    merged = np.zeros((n, 5), dtype=np.uint32)  # column 4 absorbs writes for empty cells
+    score = np.zeros(n, dtype=np.uint32)
+    slot = np.zeros(n, dtype=np.intp)
+    previous = np.zeros(n, dtype=np.uint32)
+
+    for j in range(4):
+        rank = (rows >> (4 * j)) & 0xF
+        filled = rank != 0
+        merge = filled & (rank == previous) & (rank < MAX_RANK)
+        place = filled & ~merge
+
+        merged[index, np.where(merge, slot - 1, 4)] = rank + 1
+        score += np.where(merge, np.uint32(1) << (rank + 1), 0).astype(np.uint32)
+        merged[index, np.where(place, slot, 4)] = rank
+        slot += place
+        previous = np.where(merge, 0, np.where(place, rank, previous))
+
+    packed = merged[:, 0] | (merged[:, 1] << 4) | (merged[:, 2] << 8) | (merged[:, 3] << 12)
+    return packed, score
+
+
+def _build_row_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Precompute the left move, right move, score and max rank of every row."""
+    row_left, row_score = _merge_rows_left(ROWS)
+    row_right = reverse_rows(row_left[reverse_rows(ROWS)])
+    ranks = (ROWS[:, None] >> np.arange(0, 16, 4, dtype=np.uint32)) & 0xF
+    return (
+        row_left.astype(np.uint16),
+        row_right.astype(np.uint16),
+        row_score,
+        ranks.max(axis=1).astype(np.uint8),
+    )
+
+
+# Merging pairs the same runs of equal tiles whichever way the row moves, so
+# ROW_SCORE_TABLE scores both left and right moves.
+ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE, ROW_MAX_TABLE = _build_row_tables()
+
+
+def _build_row_move_flags() -> np.ndarray:
+    """Flag, per 16-bit row, whether moving it left (bit 0) or right (bit 1) changes it."""
+    can_left = ROW_LEFT_TABLE != ROWS
+    can_right = ROW_RIGHT_TABLE != ROWS
+    return can_left.astype(np.uint8) | (can_right.astype(np.uint8) << 1)
+
+
+ROW_MOVE_FLAGS = _build_row_move_flags()
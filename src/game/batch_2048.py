@@ -0,0 +1,418 @@
+"""Batched 2048 games on uint64 bitboards."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ._kernels import NUMBA_AVAILABLE, njit, prange
+from ._tables import ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE
+from .game_2048 import _NIBBLE_SHIFTS, _TILE_VALUES
+from .game_2048 import _transpose as _transpose_bits
+
+_ROW_MASK = np.uint64(0xFFFF)
+_CELL_MASK = np.uint64(0xF)
+
+# The one CPU transpose: Python ints in Game2048, uint64 arrays in the NumPy
+# path here, and compiled for the Numba kernels
+_transpose_kernel = njit(cache=True)(_transpose_bits)
+
+# Boards per chunk in the NumPy path, keeping the temporaries of one chunk cache-resident
+_CHUNK_SIZE = 4096
+
+
+@njit(cache=True)
+def _transpose(board):
+    """
+    Compiled ``game_2048._transpose`` for uint64 bitboards.
+
+    Numba evaluates it in int64; the masks clear the sign bit before every
+    right shift, so the bits are exact and only the type needs casting back.
+    """
+    return np.uint64(_transpose_kernel(board))
+
+
+@njit(cache=True)
+def _move_rows(board, row_table, row_score):
+    """Move every row of a bitboard through a row-move table."""
+    result = np.uint64(0)
+    score = 0
+    for i in range(4):
+        shift = np.uint64(16 * i)
+        row = (board >> shift) & _ROW_MASK
+        result |= np.uint64(row_table[row]) << shift
+        score += row_score[row]
+    return result, score
+
+
+@njit(cache=True)
+def _move(board, action, row_left, row_right, row_score):
+    """Apply an action (0=UP, 1=RIGHT, 2=DOWN, 3=LEFT) to a bitboard."""
+    if action == 1:
+        return _move_rows(board, row_right, row_score)
+    if action == 3:
+        return _move_rows(board, row_left, row_score)
+    row_table = row_left if action == 0 else row_right
+    moved, score = _move_rows(_transpose(board), row_table, row_score)
+    return _transpose(moved), score
+
+
+@njit(cache=True)
+def _spawn(board, draw):
+    """Place a 2 (90%) or 4 (10%) on a random empty nibble from one uniform draw."""
+    n_empty = 0
+    for k in range(16):
+        if (board >> np.uint64(4 * k)) & _CELL_MASK == 0:
+            n_empty += 1
+    if n_empty == 0:
+        return board
+
+    position = draw * n_empty
+    target = int(position)
+    rank = np.uint64(1) if position - target < 0.9 else np.uint64(2)
+    for k in range(16):
+        shift = np.uint64(4 * k)
+        if (board >> shift) & _CELL_MASK == 0:
+            if target == 0:
+                return board | (rank << shift)
+            target -= 1
+    return board
+
+
+@njit(cache=True)
+def _is_game_over(board, row_left, row_right, row_score):
+    """Return True if no action changes the bitboard."""
+    for action in range(4):
+        moved, _ = _move(board, action, row_left, row_right, row_score)
+        if moved != board:
+            return False
+    return True
+
+
+@njit(parallel=True, cache=True)
+def _step_batch(boards, actions, draws, done, row_left, row_right, row_score):
+    """Step every unfinished game in place, returning per-game rewards."""
+    rewards = np.zeros(boards.shape[0], dtype=np.int64)
+    for i in prange(boards.shape[0]):
+        if done[i]:
+            continue
+        board = boards[i]
+        moved, score = _move(board, actions[i], row_left, row_right, row_score)
+        if moved != board:
+            boards[i] = _spawn(moved, draws[i])
+            rewards[i] = score
+            done[i] = _is_game_over(boards[i], row_left, row_right, row_score)
+    return rewards
+
+
+@njit(parallel=True, cache=True)
+def _spawn_batch(boards, draws):
+    """Add one random tile to every board in place."""
+    for i in prange(boards.shape[0]):
+        boards[i] = _spawn(boards[i], draws[i])
+
+
+@njit(parallel=True, cache=True)
+def _valid_actions_batch(boards, row_left, row_right, row_score):
+    """Return an (N, 4) mask of actions that change each board."""
+    valid = np.zeros((boards.shape[0], 4), dtype=np.bool_)
+    for i in prange(boards.shape[0]):
+        for action in range(4):
+            moved, _ = _move(boards[i], action, row_left, row_right, row_score)
+            valid[i, action] = moved != boards[i]
+    return valid
+
+
+@njit(parallel=True, cache=True)
+def _random_episodes(seeds, row_left, row_right, row_score):
+    """Play one uniformly random game per seed, returning (scores, max_ranks, steps)."""
+    n = seeds.shape[0]
+    scores = np.zeros(n, dtype=np.int64)
+    max_ranks = np.zeros(n, dtype=np.int64)
+    steps = np.zeros(n, dtype=np.int64)
+    for k in prange(n):
+        # Seeding per episode (not per thread) keeps results independent of scheduling
+        np.random.seed(seeds[k])
+        board = _spawn(_spawn(np.uint64(0), np.random.random()), np.random.random())
+        score = 0
+        n_steps = 0
+        while not _is_game_over(board, row_left, row_right, row_score):
+            moved, gained = _move(board, np.random.randint(0, 4), row_left, row_right, row_score)
+            if moved != board:
+                board = _spawn(moved, np.random.random())
+                score += gained
+                n_steps += 1
+        max_rank = 0
+        for i in range(16):
+            max_rank = max(max_rank, int((board >> np.uint64(4 * i)) & _CELL_MASK))
+        scores[k] = score
+        max_ranks[k] = max_rank
+        steps[k] = n_steps
+    return scores, max_ranks, steps
+
+
+def _random_episodes_python(seeds, row_left, row_right, row_score):
+    """
+    ``_random_episodes`` for installs without Numba.
+
+    Each episode draws from its own legacy ``RandomState``, the generator
+    Numba's ``np.random`` emulates, so results match the compiled kernel
+    without reseeding the caller's global NumPy RNG.
+    """
+    n = seeds.shape[0]
+    scores = np.zeros(n, dtype=np.int64)
+    max_ranks = np.zeros(n, dtype=np.int64)
+    steps = np.zeros(n, dtype=np.int64)
+    for k in range(n):
+        rng = np.random.RandomState(seeds[k])
+        board = _spawn(_spawn(np.uint64(0), rng.random_sample()), rng.random_sample())
+        while not _is_game_over(board, row_left, row_right, row_score):
+            moved, gained = _move(board, rng.randint(0, 4), row_left, row_right, row_score)
+            if moved != board:
+                board = _spawn(moved, rng.random_sample())
+                scores[k] += gained
+                steps[k] += 1
+        max_ranks[k] = ((board >> _NIBBLE_SHIFTS) & _CELL_MASK).max()
+    return scores, max_ranks, steps
+
+
+def _move_rows_numpy(boards, row_table, row_score):
+    """Vectorized ``_move_rows``: move every row of every bitboard with table gathers."""
+    result = np.zeros_like(boards)
+    score = np.zeros(boards.shape[0], dtype=np.int64)
+    for i in range(4):
+        shift = np.uint64(16 * i)
+        rows = ((boards >> shift) & _ROW_MASK).astype(np.intp)
+        result |= row_table[rows].astype(np.uint64) << shift
+        score += row_score[rows]
+    return result, score
+
+
+def _move_numpy(boards, action, row_left, row_right, row_score):
+    """Vectorized ``_move``: apply one action to every bitboard."""
+    if action == 1:
+        return _move_rows_numpy(boards, row_right, row_score)
+    if action == 3:
+        return _move_rows_numpy(boards, row_left, row_score)
+    row_table = row_left if action == 0 else row_right
+    moved, score = _move_rows_numpy(_transpose_bits(boards), row_table, row_score)
+    return _transpose_bits(moved), score
+
+
+def _spawn_numpy(boards, draws):
+    """Vectorized ``_spawn``, with the same draw-to-cell rule."""
+    empty = ((boards[:, None] >> _NIBBLE_SHIFTS) & _CELL_MASK) == 0
+    n_empty = empty.sum(axis=1)
+    position = draws * n_empty
+    target = position.astype(np.int64)
+    rank = np.where(position - target < 0.9, np.uint64(1), np.uint64(2))
+    # The target-th empty cell is where the running count of empties reaches target + 1
+    cell = np.argmax(empty & (np.cumsum(empty, axis=1) == target[:, None] + 1), axis=1)
+    spawned = rank << (np.uint64(4) * cell.astype(np.uint64))
+    return np.where(n_empty > 0, boards | spawned, boards)
+
+
+def _valid_actions_numpy(boards, row_left, row_right, row_score):
+    """Vectorized ``_valid_actions_batch``."""
+    valid = np.zeros((boards.shape[0], 4), dtype=np.bool_)
+    for action in range(4):
+        moved, _ = _move_numpy(boards, action, row_left, row_right, row_score)
+        valid[:, action] = moved != boards
+    return valid
+
+
+def _step_batch_numpy(boards, actions, draws, done, row_left, row_right, row_score):
+    """
+    Vectorized ``_step_batch`` for installs without Numba.
+
+    Boards are processed in chunks, each action applied to its games with
+    table gathers over whole arrays instead of one Python loop per game.
+    """
+    rewards = np.zeros(boards.shape[0], dtype=np.int64)
+    for start in range(0, boards.shape[0], _CHUNK_SIZE):
+        chunk = slice(start, start + _CHUNK_SIZE)
+        chunk_boards = boards[chunk]
+        chunk_actions = actions[chunk]
+        moved = chunk_boards.copy()
+        score = np.zeros(chunk_boards.shape[0], dtype=np.int64)
+        for action in range(4):
+            selected = chunk_actions == action
+            if selected.any():
+                moved[selected], score[selected] = _move_numpy(
+                    chunk_boards[selected], action, row_left, row_right, row_score
+                )
+
+        changed = (moved != chunk_boards) & ~done[chunk]
+        spawned = _spawn_numpy(moved[changed], draws[chunk][changed])
+        chunk_boards[changed] = spawned
+        rewards[chunk][changed] = score[changed]
+        done[chunk][changed] = ~_valid_actions_numpy(spawned, row_left, row_right, row_score).any(
+            axis=1
+        )
+    return rewards
+
+
+def _spawn_batch_numpy(boards, draws):
+    """Vectorized ``_spawn_batch``."""
+    boards[:] = _spawn_numpy(boards, draws)
+
+
+# Without Numba the scalar kernels run as plain Python, one game at a time;
+# the whole-array NumPy versions are much faster there.
+if NUMBA_AVAILABLE:
+    _STEP_BATCH, _SPAWN_BATCH, _VALID_ACTIONS_BATCH, _RANDOM_EPISODES = (
+        _step_batch,
+        _spawn_batch,
+        _valid_actions_batch,
+        _random_episodes,
+    )
+else:  # pragma: no cover - exercised only without numba
+    _STEP_BATCH, _SPAWN_BATCH, _VALID_ACTIONS_BATCH, _RANDOM_EPISODES = (
+        _step_batch_numpy,
+        _spawn_batch_numpy,
+        _valid_actions_numpy,
+        _random_episodes_python,
+    )
+
+
+def run_random_episodes(seeds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Play one uniformly random game per seed, in parallel across games.
+
+    The random agent picks among all four actions and retries invalid ones,
+    which is equivalent to choosing uniformly among the valid actions.
+
+    Args:
+        seeds: (N,) episode seeds in [0, 2**32)
+
+    Returns:
+        Tuple of (scores, max_tiles, steps), each of shape (N,)
+    """
+    seeds = np.asarray(seeds, dtype=np.int64)
+    scores, max_ranks, steps = _RANDOM_EPISODES(
+        seeds, ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE
+    )
+    return scores, np.where(max_ranks > 0, 1 << max_ranks, 0), steps
+
+
+def decode_bitboards(bitboards: np.ndarray) -> np.ndarray:
+    """
+    Expand an array of bitboards into grids of tile values.
+
+    Args:
+        bitboards: (N,) uint64 bitboards
+
+    Returns:
+        (N, 4, 4) int32 boards
+    """
+    ranks = (bitboards[:, None] >> _NIBBLE_SHIFTS) & _CELL_MASK
+    return _TILE_VALUES[ranks].reshape(-1, 4, 4)
+
+
+class BatchGame2048:
+    """
+    N independent 4x4 games stepped together.
+
+    Boards are stored as an ``(N,) uint64`` bitboard array and every call to
+    ``step`` advances all games in a single compiled (and, with Numba,
+    parallel) kernel, amortizing Python overhead across the batch. Without
+    Numba the step is vectorized with NumPy table gathers instead. Finished
+    games are frozen until ``reset``.
+    """
+
+    def __init__(self, n_games: int, seed: Optional[int] = None):
+        """
+        Initialize the batch.
+
+        Args:
+            n_games: Number of games to run in parallel
+            seed: Random seed for reproducibility
+        """
+        self.n_games = n_games
+        self.rng = np.random.Generator(np.random.SFC64(seed))
+        self.bitboards = np.zeros(n_games, dtype=np.uint64)
+        self.scores = np.zeros(n_games, dtype=np.int64)
+        self.dones = np.zeros(n_games, dtype=np.bool_)
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Reset every game to an initial state.
+
+        Args:
+            seed: Optional new random seed
+
+        Returns:
+            (N, 4, 4) initial boards
+        """
+        if seed is not None:
+            self.rng = np.random.Generator(np.random.SFC64(seed))
+        self.bitboards[:] = 0
+        self.scores[:] = 0
+        self.dones[:] = False
+        for _ in range(2):
+            _SPAWN_BATCH(self.bitboards, self.rng.random(self.n_games))
+        return self.boards
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Execute one action in every game.
+
+        Actions that do not change a board leave it unchanged with zero
+        reward, matching ``Game2048.step``. Actions outside 0-3 raise
+        ValueError.
+
+        Args:
+            actions: (N,) actions (0=UP, 1=RIGHT, 2=DOWN, 3=LEFT)
+
+        Returns:
+            Tuple of (boards, rewards, dones)
+            - boards: (N, 4, 4) updated boards
+            - rewards: (N,) score gained by each game
+            - dones: (N,) whether each game is over
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.n_games,):
+            raise ValueError(f"Expected actions of shape {(self.n_games,)}, got {actions.shape}")
+        # The kernels read any other value as some direction, differently per backend
+        if not ((actions >= 0) & (actions < 4)).all():
+            raise ValueError(
+                f"Actions must be in 0-3, got {actions[(actions < 0) | (actions >= 4)]}"
+            )
+
+        draws = self.rng.random(self.n_games)
+        rewards = _STEP_BATCH(
+            self.bitboards,
+            actions,
+            draws,
+            self.dones,
+            ROW_LEFT_TABLE,
+            ROW_RIGHT_TABLE,
+            ROW_SCORE_TABLE,
+        )
+        self.scores += rewards
+        return self.boards, rewards, self.dones.copy()
+
+    def get_valid_actions_batch(self) -> np.ndarray:
+        """
+        Get the valid actions of every game.
+
+        Returns:
+            (N, 4) bool mask, True where the action would change the board
+        """
+        return _VALID_ACTIONS_BATCH(
+            self.bitboards, ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE
+        )
+
+    @property
+    def boards(self) -> np.ndarray:
+        """(N, 4, 4) boards of tile values."""
+        return decode_bitboards(self.bitboards)
+
+    @property
+    def max_tiles(self) -> np.ndarray:
+        """(N,) largest tile in each game."""
+        return self.boards.reshape(self.n_games, -1).max(axis=1)
+
+    def __len__(self) -> int:
+        """Return the number of games in the batch."""
+        return self.n_games
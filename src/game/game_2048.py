@@ -1,10 +1,235 @@
 """Core 2048 game logic."""
 
 from enum import IntEnum
-from typing import Optional, Tuple
+from functools import partial
+from typing import Optional, Tuple, Union
 
 import numpy as np
 
+try:
+    # Ahead-of-time compiled build (python setup.py build_ext --inplace)
+    from . import _kernels_c as _kernels
+except ImportError:
+    from . import _kernels
+from ._tables import (
+    MAX_RANK,
+    ROW_LEFT_TABLE,
+    ROW_MAX_TABLE,
+    ROW_MOVE_FLAGS,
+    ROW_RIGHT_TABLE,
+    ROW_SCORE_TABLE,
+)
+
+# Bitboard layout: row i occupies bits 16*i..16*i+15 and cell (i, j) is the
+# nibble at bits 16*i + 4*j, holding log2 of the tile value (0 = empty).
+_ROW_MASK = 0xFFFF
+_BITBOARD_SIZE = 4
+
+# Tile value for each nibble rank, used to decode the bitboard into a grid.
+_TILE_VALUES = np.array([0] + [1 << rank for rank in range(1, MAX_RANK + 1)], dtype=np.int32)
+_NIBBLE_SHIFTS = np.arange(0, 64, 4, dtype=np.uint64)
+
+# The NumPy grid backend stores int8 log2 ranks; ranks above 30 overflow int32 values.
+_GRID_MAX_RANK = 30
+_GRID_TILE_VALUES = np.array(
+    [0] + [1 << rank for rank in range(1, _GRID_MAX_RANK + 1)], dtype=np.int32
+)
+
+
+# Python-list mirrors: indexing a list with an int is cheaper than indexing an
+# ndarray and keeps the bitboard arithmetic in unbounded Python ints.
+_ROW_LEFT = ROW_LEFT_TABLE.tolist()
+_ROW_RIGHT = ROW_RIGHT_TABLE.tolist()
+_ROW_SCORE = ROW_SCORE_TABLE.tolist()
+_ROW_MAX = ROW_MAX_TABLE.tolist()
+_ROW_MOVE_FLAGS = ROW_MOVE_FLAGS.tolist()
+
+
+def _merge_line_reference(line: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Merge a line of tile values to the left, one tile at a time.
+
+    Reference merge for any line length and tile value; the row tables and
+    compiled kernels are checked against it.
+
+    Args:
+        line: Row of tile values
+
+    Returns:
+        Tuple of (merged row, score gained)
+    """
+    # Remove zeros
+    non_zero = line[line != 0]
+
+    # Merge adjacent equal values
+    merged = []
+    score = 0
+    i = 0
+    while i < len(non_zero):
+        if i + 1 < len(non_zero) and non_zero[i] == non_zero[i + 1]:
+            # Merge tiles
+            merged_value = non_zero[i] * 2
+            merged.append(merged_value)
+            score += merged_value
+            i += 2
+        else:
+            merged.append(non_zero[i])
+            i += 1
+
+    # Pad with zeros
+    result = np.zeros(len(line), dtype=np.int32)
+    result[: len(merged)] = merged
+    return result, score
+
+
+def _transpose(board: int) -> int:
+    """
+    Transpose a bitboard so that columns become rows.
+
+    Shared by every CPU path: it also works elementwise on uint64 arrays and
+    compiles under Numba (see ``batch_2048``).
+    """
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def _bitboard_left(board: int) -> Tuple[int, int]:
+    """Move a bitboard left, returning (new_board, score_gained)."""
+    result = 0
+    score = 0
+    for shift in (0, 16, 32, 48):
+        row = (board >> shift) & _ROW_MASK
+        result |= _ROW_LEFT[row] << shift
+        score += _ROW_SCORE[row]
+    return result, score
+
+
+def _bitboard_right(board: int) -> Tuple[int, int]:
+    """Move a bitboard right, returning (new_board, score_gained)."""
+    result = 0
+    score = 0
+    for shift in (0, 16, 32, 48):
+        row = (board >> shift) & _ROW_MASK
+        result |= _ROW_RIGHT[row] << shift
+        score += _ROW_SCORE[row]
+    return result, score
+
+
+def _bitboard_up(board: int) -> Tuple[int, int]:
+    """Move a bitboard up, returning (new_board, score_gained)."""
+    result, score = _bitboard_left(_transpose(board))
+    return _transpose(result), score
+
+
+def _bitboard_down(board: int) -> Tuple[int, int]:
+    """Move a bitboard down, returning (new_board, score_gained)."""
+    result, score = _bitboard_right(_transpose(board))
+    return _transpose(result), score
+
+
+def _valid_action_bits(board: int) -> int:
+    """Return a 4-bit mask with bit ``a`` set iff Action ``a`` changes the bitboard."""
+    horizontal = 0
+    vertical = 0
+    transposed = _transpose(board)
+    for shift in (0, 16, 32, 48):
+        horizontal |= _ROW_MOVE_FLAGS[(board >> shift) & _ROW_MASK]
+        vertical |= _ROW_MOVE_FLAGS[(transposed >> shift) & _ROW_MASK]
+    # Left/right on the transpose are up/down on the board
+    return (vertical & 1) | (horizontal & 2) | ((vertical & 2) << 1) | ((horizontal & 1) << 3)
+
+
+# Valid actions for each 4-bit valid-action mask
+_MASK_ACTIONS = tuple(
+    tuple(action for action in range(4) if (mask >> action) & 1) for mask in range(16)
+)
+
+# Indexed by Action value
+_BITBOARD_MOVES = (_bitboard_up, _bitboard_right, _bitboard_down, _bitboard_left)
+
+
+def _empty_cell_mask(board: int) -> int:
+    """Return a 16-bit mask with bit ``k`` set iff nibble ``k`` of the bitboard is empty."""
+    occupied = board | (board >> 1)
+    occupied |= occupied >> 2
+    # Bit 4k is set iff nibble k is zero
+    empty = ~occupied & 0x1111111111111111
+    # Compress the bits at positions 4k down to position k
+    empty = (empty | (empty >> 3)) & 0x0303030303030303
+    empty = (empty | (empty >> 6)) & 0x000F000F000F000F
+    empty = (empty | (empty >> 12)) & 0x000000FF000000FF
+    return (empty | (empty >> 24)) & 0xFFFF
+
+
+_NIBBLE_LOW_BITS = 0x1111111111111111
+_NIBBLE_HIGH_BITS = 0x8888888888888888
+_LAST_COLUMN = 0xF000F000F000F000
+_LAST_ROW = 0xFFFF000000000000
+
+
+def _has_zero_nibble(x: int) -> bool:
+    """Return True if any of the 16 nibbles of ``x`` is zero."""
+    return ((x - _NIBBLE_LOW_BITS) & ~x & _NIBBLE_HIGH_BITS) != 0
+
+
+def _any_move_possible(board: int) -> bool:
+    """
+    Branch-free check for an empty cell or a mergeable neighbour pair.
+
+    XOR-ing the board with itself shifted by one column (or row) leaves a
+    zero nibble exactly where two neighbours are equal. Lanes without a
+    neighbour, and rank-15 tiles (which do not merge), are forced non-zero.
+    """
+    if _has_zero_nibble(board):
+        return True
+    full = board & (board >> 1) & (board >> 2) & (board >> 3) & _NIBBLE_LOW_BITS
+    unmergeable = full * 0xF
+    horizontal = (board ^ (board >> 4)) | _LAST_COLUMN | unmergeable
+    vertical = (board ^ (board >> 16)) | _LAST_ROW | unmergeable
+    return _has_zero_nibble(horizontal) or _has_zero_nibble(vertical)
+
+
+def _max_tile(board: int) -> int:
+    """Return the largest tile value on a bitboard."""
+    rank = max(_ROW_MAX[(board >> shift) & _ROW_MASK] for shift in (0, 16, 32, 48))
+    return 1 << rank if rank else 0
+
+
+def _decode_bitboard(board: int) -> np.ndarray:
+    """Expand a bitboard into a 4x4 grid of tile values."""
+    ranks = (np.uint64(board) >> _NIBBLE_SHIFTS) & np.uint64(0xF)
+    return _TILE_VALUES[ranks].reshape(_BITBOARD_SIZE, _BITBOARD_SIZE)
+
+
+def _encode_bitboard(grid: np.ndarray) -> int:
+    """Pack a 4x4 grid of tile values into a bitboard."""
+    board = 0
+    for k, value in enumerate(grid.ravel().tolist()):
+        if value == 0:
+            continue
+        rank = int(value).bit_length() - 1
+        if value != 1 << rank or not 1 <= rank <= MAX_RANK:
+            raise ValueError(f"Invalid tile value for bitboard: {value}")
+        board |= rank << (4 * k)
+    return board
+
+
+def _encode_grid(grid: np.ndarray) -> np.ndarray:
+    """Convert a grid of tile values into the int8 log2 ranks of the grid backend."""
+    values = np.asarray(grid, dtype=np.int64)
+    ranks = np.zeros(values.shape, dtype=np.int8)
+    positive = values > 0
+    ranks[positive] = np.clip(np.log2(values[positive]).round(), 1, _GRID_MAX_RANK)
+    if not np.array_equal(_GRID_TILE_VALUES[ranks], values):
+        raise ValueError("Board tiles must be 0 or powers of two from 2 to 2**30")
+    return ranks
+
 
 class Action(IntEnum):
     """Available actions in the game."""
@@ -21,69 +246,186 @@ class Game2048:
 
     The game is played on a 4x4 grid. Tiles with powers of 2 can be merged
     by moving them in one of four directions (up, down, left, right).
+
+    The standard 4x4 board is stored as a single 64-bit integer with one
+    log2 nibble per cell, so moves are four row-table lookups. Other board
+    sizes, or ``backend="numpy"``, use an int8 NumPy grid of log2 ranks.
+    ``board`` materialises the grid of tile values on access.
     """
 
-    def __init__(self, size: int = 4, seed: Optional[int] = None):
+    BACKENDS = ("bitboard", "numpy")
+
+    def __init__(self, size: int = 4, seed: Optional[int] = None, backend: Optional[str] = None):
         """
         Initialize the game.
 
         Args:
             size: Board size (default 4 for 4x4 grid)
             seed: Random seed for reproducibility
+            backend: Board representation, "bitboard" (4x4 only) or "numpy".
+                Defaults to "bitboard" for 4x4 boards and "numpy" otherwise.
         """
+        if backend is None:
+            backend = "bitboard" if size == _BITBOARD_SIZE else "numpy"
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {self.BACKENDS}")
+        if backend == "bitboard" and size != _BITBOARD_SIZE:
+            raise ValueError(f"The bitboard backend only supports size {_BITBOARD_SIZE}")
+
         self.size = size
-        self.rng = np.random.RandomState(seed)
-        self.board = np.zeros((size, size), dtype=np.int32)
+        self.backend = backend
+        self.rng = np.random.Generator(np.random.SFC64(seed))
+        self._bitboard: Optional[int] = None
+        self._grid: Optional[np.ndarray] = None
+        self._bind_moves()
+        self._clear_board()
         self.score = 0
         self.max_tile = 0
         self._add_random_tile()
         self._add_random_tile()
 
-    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+    def _bind_moves(self):
+        """Bind the move functions of the backend, indexed by Action value."""
+        # Bound once so _move is a single table call
+        if self.backend == "bitboard":
+            self._move_fns = tuple(
+                partial(self._apply_bitboard_move, move) for move in _BITBOARD_MOVES
+            )
+        else:
+            _kernels.warm_up()
+            moves = (_kernels.move_up, _kernels.move_right, _kernels.move_down, _kernels.move_left)
+            self._move_fns = tuple(partial(self._apply_grid_move, move) for move in moves)
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random generator for tile spawns."""
+        if self._rng is None:
+            # Lazily fork a clone's generator from the state captured by clone()
+            state = self._rng_state
+            bit_generator = getattr(np.random, state["bit_generator"])(0)
+            bit_generator.state = state
+            self._rng = np.random.Generator(bit_generator)
+            self._rng_state = None
+        return self._rng
+
+    @rng.setter
+    def rng(self, value: np.random.Generator):
+        self._rng = value
+        self._rng_state = None
+
+    def reset(self, seed: Optional[int] = None, copy: bool = False) -> np.ndarray:
         """
         Reset the game to initial state.
 
         Args:
             seed: Optional new random seed
+            copy: Return a writable copy instead of a read-only board
 
         Returns:
             Initial board state
         """
         if seed is not None:
-            self.rng = np.random.RandomState(seed)
-        self.board = np.zeros((self.size, self.size), dtype=np.int32)
+            self.rng = np.random.Generator(np.random.SFC64(seed))
+        self._clear_board()
         self.score = 0
         self.max_tile = 0
         self._add_random_tile()
         self._add_random_tile()
-        return self.board.copy()
+        return self._board_snapshot(copy)
+
+    @property
+    def board(self) -> np.ndarray:
+        """
+        Board as a grid of tile values (0 for empty), decoded on every access.
+
+        The grid is read-only, since writing into a decoded copy would not
+        change the game; assign a whole board to ``board`` instead.
+        """
+        board = self._decode_board()
+        board.flags.writeable = False
+        return board
+
+    @board.setter
+    def board(self, value: np.ndarray):
+        grid = np.asarray(value)
+        if grid.shape != (self.size, self.size):
+            raise ValueError(f"Expected board of shape {(self.size, self.size)}, got {grid.shape}")
+        if self.backend == "bitboard":
+            self._bitboard = _encode_bitboard(grid)
+        else:
+            self._grid = _encode_grid(grid)
+
+    @property
+    def bitboard(self) -> int:
+        """
+        Packed 64-bit board of the bitboard backend.
+
+        Cell (i, j) is the nibble at bits ``16*i + 4*j`` holding the log2 of
+        its tile (0 = empty), the layout of ``BatchGame2048.bitboards``.
+        """
+        if self._bitboard is None:
+            raise ValueError(f"The {self.backend} backend has no bitboard")
+        return self._bitboard
+
+    @bitboard.setter
+    def bitboard(self, value: int):
+        if self._bitboard is None:
+            raise ValueError(f"The {self.backend} backend has no bitboard")
+        value = int(value)
+        if not 0 <= value < 1 << 64:
+            raise ValueError(f"Bitboard out of range: {value}")
+        self._bitboard = value
+
+    def _decode_board(self) -> np.ndarray:
+        """Decode the board into a fresh, writable grid of tile values."""
+        if self._bitboard is None:
+            return _GRID_TILE_VALUES[self._grid]
+        return _decode_bitboard(self._bitboard)
+
+    def _clear_board(self):
+        """Empty the board using the representation of the selected backend."""
+        if self.backend == "bitboard":
+            self._bitboard = 0
+        else:
+            self._grid = np.zeros((self.size, self.size), dtype=np.int8)
+
+    def _board_snapshot(self, copy: bool) -> np.ndarray:
+        """
+        Return the board for callers of ``step``/``reset``.
 
-    def step(self, action: int) -> Tuple[np.ndarray, int, bool]:
+        The returned array is read-only unless ``copy`` is set. Both backends
+        decode into a fresh array, so it never aliases game state.
+        """
+        board = self._decode_board()
+        if not copy:
+            board.flags.writeable = False
+        return board
+
+    def step(self, action: int, copy: bool = False) -> Tuple[np.ndarray, int, bool]:
         """
         Execute one action.
 
         Args:
             action: Action to take (0=UP, 1=RIGHT, 2=DOWN, 3=LEFT)
+            copy: Return a writable copy instead of a read-only board
 
         Returns:
             Tuple of (new_board, reward, done)
-            - new_board: Updated board state
+            - new_board: Updated board state (read-only unless ``copy``)
             - reward: Score gained from this move
             - done: Whether game is over
         """
-        if not self.is_valid_action(action):
-            # Invalid move - no change
-            return self.board.copy(), 0, self.is_game_over()
-
         old_score = self.score
-        self._move(action)
+        if not self._move(action):
+            # Invalid move - no change
+            return self._board_snapshot(copy), 0, self.is_game_over()
         reward = self.score - old_score
 
         # Add new tile only if move was valid
         self._add_random_tile()
 
         done = self.is_game_over()
-        return self.board.copy(), reward, done
+        return self._board_snapshot(copy), reward, done
 
     def is_valid_action(self, action: int) -> bool:
         """
@@ -95,13 +437,11 @@ class Game2048:
         Returns:
             True if action is valid (would change board)
         """
-        temp_board = self.board.copy()
-        temp_score = self.score
-        self._move(action)
-        is_valid = not np.array_equal(temp_board, self.board)
-        self.board = temp_board
-        self.score = temp_score
-        return is_valid
+        if not 0 <= action < 4:
+            return False
+        if self._bitboard is not None:
+            return bool((_valid_action_bits(self._bitboard) >> action) & 1)
+        return bool(_kernels.would_change(self._grid, action))
 
     def get_valid_actions(self) -> list[int]:
         """
@@ -110,7 +450,23 @@ class Game2048:
         Returns:
             List of valid action indices
         """
-        return [action for action in range(4) if self.is_valid_action(action)]
+        return list(_MASK_ACTIONS[self.valid_actions_mask()])
+
+    def valid_actions_mask(self) -> int:
+        """
+        Get the valid actions as a bitmask, for masking without allocating a list.
+
+        Returns:
+            Int with bit ``a`` set iff action ``a`` is valid (e.g. 0b1011 when
+            only DOWN is invalid); 0 when the game is over
+        """
+        if self._bitboard is not None:
+            return _valid_action_bits(self._bitboard)
+        mask = 0
+        for action in range(4):
+            if _kernels.would_change(self._grid, action):
+                mask |= 1 << action
+        return mask
 
     def is_game_over(self) -> bool:
         """
@@ -119,22 +475,10 @@ class Game2048:
         Returns:
             True if no valid moves remain
         """
-        # Check if any cell is empty
-        if np.any(self.board == 0):
-            return False
-
-        # Check if any adjacent cells can be merged
-        for i in range(self.size):
-            for j in range(self.size):
-                current = self.board[i, j]
-                # Check right
-                if j < self.size - 1 and self.board[i, j + 1] == current:
-                    return False
-                # Check down
-                if i < self.size - 1 and self.board[i + 1, j] == current:
-                    return False
+        if self._bitboard is not None:
+            return not _any_move_possible(self._bitboard)
 
-        return True
+        return bool(_kernels.is_game_over(self._grid))
 
     def has_won(self) -> bool:
         """
@@ -152,89 +496,122 @@ class Game2048:
         Returns:
             True if tile was added, False if board is full
         """
-        empty_cells = np.argwhere(self.board == 0)
-        if len(empty_cells) == 0:
+        if self._bitboard is not None:
+            return self._add_random_tile_bitboard()
+
+        # 90% chance of 2, 10% chance of 4
+        rank = _kernels.add_random_tile(self._grid, self.rng.random())
+        if rank == 0:
+            return False
+        self.max_tile = max(self.max_tile, 1 << rank)
+        return True
+
+    def _add_random_tile_bitboard(self) -> bool:
+        """Bitboard variant of ``_add_random_tile`` drawing a single uniform."""
+        board = self._bitboard
+        empty_mask = _empty_cell_mask(board)
+        if not empty_mask:
             return False
 
-        # Pick random empty cell
-        idx = self.rng.randint(len(empty_cells))
-        i, j = empty_cells[idx]
+        # Integer part picks the cell, fractional part picks 2 (90%) or 4 (10%)
+        position = self.rng.random() * bin(empty_mask).count("1")
+        index = int(position)
+        for _ in range(index):
+            empty_mask &= empty_mask - 1  # Drop the lowest empty cell
+        k = (empty_mask & -empty_mask).bit_length() - 1
+        rank = 1 if position - index < 0.9 else 2
+        self._bitboard = board | (rank << (4 * k))
+        self.max_tile = max(self.max_tile, 1 << rank)
+        return True
 
-        # 90% chance of 2, 10% chance of 4
-        value = 2 if self.rng.random() < 0.9 else 4
-        self.board[i, j] = value
-        self.max_tile = max(self.max_tile, value)
+    def _apply_bitboard_move(self, move) -> bool:
+        """Apply a bitboard move function, returning whether the board changed."""
+        moved, gained = move(self._bitboard)
+        if moved == self._bitboard:
+            return False
+        self._bitboard = moved
+        if gained:
+            self.score += gained
+            self.max_tile = max(self.max_tile, _max_tile(moved))
+        return True
+
+    def _apply_grid_move(self, move) -> bool:
+        """Apply a compiled grid kernel, returning whether the board changed."""
+        moved, gained = move(self._grid)
+        # Both boards are contiguous int8, so a bytes compare is a plain memcmp
+        # without np.array_equal's temporary bool array and reduction.
+        if moved.tobytes() == self._grid.tobytes():
+            return False
+        self._grid = moved
+        if gained:
+            self.score += int(gained)
+            self.max_tile = max(self.max_tile, 1 << int(moved.max()))
         return True
 
-    def _move(self, action: int):
+    def _move(self, action: int) -> bool:
         """
         Execute a move in the given direction.
 
         Args:
             action: Direction to move (0=UP, 1=RIGHT, 2=DOWN, 3=LEFT)
+
+        Returns:
+            True if the board changed
         """
-        if action == Action.UP:
-            self._move_up()
-        elif action == Action.RIGHT:
-            self._move_right()
-        elif action == Action.DOWN:
-            self._move_down()
-        elif action == Action.LEFT:
-            self._move_left()
+        if not 0 <= action < 4:
+            return False
+        return self._move_fns[action]()
 
-    def _move_left(self):
+    def _move_left(self) -> bool:
         """Move and merge tiles to the left."""
-        for i in range(self.size):
-            self.board[i] = self._merge_line(self.board[i])
+        return self._move_fns[Action.LEFT]()
 
-    def _move_right(self):
+    def _move_right(self) -> bool:
         """Move and merge tiles to the right."""
-        for i in range(self.size):
-            self.board[i] = self._merge_line(self.board[i][::-1])[::-1]
+        return self._move_fns[Action.RIGHT]()
 
-    def _move_up(self):
+    def _move_up(self) -> bool:
         """Move and merge tiles upward."""
-        self.board = self.board.T
-        self._move_left()
-        self.board = self.board.T
+        return self._move_fns[Action.UP]()
 
-    def _move_down(self):
+    def _move_down(self) -> bool:
         """Move and merge tiles downward."""
-        self.board = self.board.T
-        self._move_right()
-        self.board = self.board.T
+        return self._move_fns[Action.DOWN]()
 
     def _merge_line(self, line: np.ndarray) -> np.ndarray:
         """
         Merge a single line (row) to the left.
 
+        Four-tile lines are one row-table lookup; other lengths, and tiles the
+        tables cannot hold, use the reference merge.
+
         Args:
             line: Row to merge
 
         Returns:
             Merged row
         """
-        # Remove zeros
-        non_zero = line[line != 0]
-
-        # Merge adjacent equal values
-        merged = []
-        i = 0
-        while i < len(non_zero):
-            if i + 1 < len(non_zero) and non_zero[i] == non_zero[i + 1]:
-                # Merge tiles
-                merged_value = non_zero[i] * 2
-                merged.append(merged_value)
-                self.score += merged_value
-                self.max_tile = max(self.max_tile, merged_value)
-                i += 2
+        if len(line) == _BITBOARD_SIZE:
+            row = 0
+            for j, value in enumerate(line.tolist()):
+                value = int(value)
+                rank = value.bit_length() - 1 if value > 0 else 0
+                # Two rank-15 tiles never merge in the tables, so stop below that
+                if value and (1 << rank != value or not 1 <= rank < MAX_RANK):
+                    break
+                row |= rank << (4 * j)
             else:
-                merged.append(non_zero[i])
-                i += 1
-
-        # Pad with zeros
-        result = np.zeros(self.size, dtype=np.int32)
-        result[: len(merged)] = merged
+                merged_row = _ROW_LEFT[row]
+                score = _ROW_SCORE[row]
+                if score:
+                    self.score += score
+                    self.max_tile = max(self.max_tile, 1 << _ROW_MAX[merged_row])
+                return _TILE_VALUES[[(merged_row >> (4 * j)) & 0xF for j in range(4)]]
+
+        result, score = _merge_line_reference(line)
+        if score:
+            self.score += score
+            self.max_tile = max(self.max_tile, int(result.max()))
         return result
 
     def get_state(self) -> dict:
@@ -245,28 +622,87 @@ class Game2048:
             Dictionary with board, score, max_tile, done, won
         """
         return {
-            "board": self.board.copy(),
+            "board": self._board_snapshot(copy=True),
             "score": self.score,
             "max_tile": self.max_tile,
             "done": self.is_game_over(),
             "won": self.has_won(),
         }
 
+    def snapshot(self) -> Tuple[Union[int, np.ndarray], int, int]:
+        """
+        Capture the minimal game state for search algorithms.
+
+        For the 4x4 bitboard this is three ints, so taking a snapshot does not
+        allocate any array. The grid backend copies its 1-byte-per-cell ranks.
+
+        Returns:
+            Tuple of (bitboard or rank-grid copy, score, max_tile)
+        """
+        board = self._bitboard if self._bitboard is not None else self._grid.copy()
+        return board, self.score, self.max_tile
+
+    def restore(self, snapshot: Tuple[Union[int, np.ndarray], int, int]):
+        """
+        Restore a state captured with ``snapshot``.
+
+        Args:
+            snapshot: Tuple returned by ``snapshot``
+        """
+        board, self.score, self.max_tile = snapshot
+        if self._bitboard is not None:
+            self._bitboard = board
+        else:
+            self._grid = board.copy()
+
     def clone(self) -> "Game2048":
         """
         Create a deep copy of the game state.
 
+        The clone continues the random stream from the current RNG state, but
+        its generator is only built on its first draw, so clones used purely
+        for move lookahead never pay for one. Clones of clones share the same
+        captured state.
+
         Returns:
             New Game2048 instance with same state
         """
-        game = Game2048(size=self.size)
-        game.board = self.board.copy()
+        game = Game2048.__new__(Game2048)
+        game.size = self.size
+        game.backend = self.backend
+        game._bitboard = self._bitboard
+        game._grid = None if self._grid is None else self._grid.copy()
         game.score = self.score
         game.max_tile = self.max_tile
-        game.rng = np.random.RandomState()
-        game.rng.set_state(self.rng.get_state())
+        game._bind_moves()
+        game._rng = None
+        game._rng_state = self._rng_state if self._rng is None else self._rng.bit_generator.state
         return game
 
+    def __eq__(self, other: object) -> bool:
+        """Games are equal when their boards are equal (score and RNG are ignored)."""
+        if not isinstance(other, Game2048):
+            return NotImplemented
+        if self._bitboard is not None and other._bitboard is not None:
+            return self._bitboard == other._bitboard
+        return self.size == other.size and self.board.tobytes() == other.board.tobytes()
+
+    def __hash__(self) -> int:
+        """
+        Hash of the current board, for transposition tables in search code.
+
+        The 4x4 bitboard is an exact 64-bit key, so no Zobrist table is needed.
+        A 4x4 grid-backend game hashes the same packed key, since it compares
+        equal to a bitboard game with the same board. The hash changes as the
+        game is played; don't mutate a game while it is a dict key.
+        """
+        if self._bitboard is not None:
+            return hash(self._bitboard)
+        ranks = self._grid.ravel()
+        if self.size == _BITBOARD_SIZE and ranks.max() <= MAX_RANK:
+            return hash(int((ranks.astype(np.uint64) << _NIBBLE_SHIFTS).sum()))
+        return hash(self._grid.tobytes())
+
     def __str__(self) -> str:
         """String representation of the board."""
         lines = [f"Score: {self.score}  Max Tile: {self.max_tile}"]
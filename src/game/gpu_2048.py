@@ -0,0 +1,164 @@
+"""CUDA batch stepping of 4x4 bitboard games with CuPy.
+
+Optional GPU counterpart of ``BatchGame2048.step`` for mass self-play: one
+thread per game applies the action through the row tables, spawns a tile and
+updates the game-over flag. Requires ``cupy`` (``pip install rl-2048[gpu]``);
+importing this module without it is fine, calling ``step_batch_gpu`` is not.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from ._tables import ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE
+
+try:
+    import cupy as cp
+except ImportError:  # pragma: no cover - exercised only without cupy
+    cp = None
+
+# The row tables are 128 KiB each, above the 64 KiB of __constant__ memory, so
+# they are passed as read-only global arrays and served from the L1/tex cache.
+_KERNEL_SOURCE = r"""
+typedef unsigned long long u64;
+
+__device__ __forceinline__ u64 transpose(u64 b) {
+    u64 a1 = b & 0xF0F00F0FF0F00F0FULL;
+    u64 a2 = b & 0x0000F0F00000F0F0ULL;
+    u64 a3 = b & 0x0F0F00000F0F0000ULL;
+    u64 a = a1 | (a2 << 12) | (a3 >> 12);
+    u64 b1 = a & 0xFF00FF0000FF00FFULL;
+    u64 b2 = a & 0x00FF00FF00000000ULL;
+    u64 b3 = a & 0x00000000FF00FF00ULL;
+    return b1 | (b2 >> 24) | (b3 << 24);
+}
+
+__device__ __forceinline__ u64 move_rows(u64 b, const unsigned short* __restrict__ table,
+                                         const unsigned int* __restrict__ row_score,
+                                         long long* score) {
+    u64 result = 0;
+    for (int shift = 0; shift < 64; shift += 16) {
+        unsigned int row = (unsigned int)((b >> shift) & 0xFFFFULL);
+        result |= (u64)__ldg(&table[row]) << shift;
+        *score += __ldg(&row_score[row]);
+    }
+    return result;
+}
+
+__device__ u64 move(u64 b, int action, const unsigned short* __restrict__ row_left,
+                    const unsigned short* __restrict__ row_right,
+                    const unsigned int* __restrict__ row_score, long long* score) {
+    // 0=UP, 1=RIGHT, 2=DOWN, 3=LEFT
+    if (action == 1) return move_rows(b, row_right, row_score, score);
+    if (action == 3) return move_rows(b, row_left, row_score, score);
+    const unsigned short* table = action == 0 ? row_left : row_right;
+    return transpose(move_rows(transpose(b), table, row_score, score));
+}
+
+__device__ u64 spawn(u64 b, double draw) {
+    int n_empty = 0;
+    for (int k = 0; k < 16; k++) n_empty += ((b >> (4 * k)) & 0xFULL) == 0;
+    if (n_empty == 0) return b;
+    double position = draw * n_empty;
+    int target = (int)position;
+    u64 rank = (position - target < 0.9) ? 1ULL : 2ULL;
+    for (int k = 0; k < 16; k++) {
+        if (((b >> (4 * k)) & 0xFULL) == 0) {
+            if (target == 0) return b | (rank << (4 * k));
+            target--;
+        }
+    }
+    return b;
+}
+
+extern "C" __global__ void step_batch(u64* boards, const unsigned char* actions,
+                                      const double* draws,
+                                      const unsigned short* __restrict__ row_left,
+                                      const unsigned short* __restrict__ row_right,
+                                      const unsigned int* __restrict__ row_score,
+                                      long long* rewards, bool* done, int n) {
+    int i = blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) return;
+    rewards[i] = 0;
+    if (done[i]) return;
+
+    u64 b = boards[i];
+    long long score = 0;
+    u64 moved = move(b, actions[i], row_left, row_right, row_score, &score);
+    if (moved == b) return;
+
+    b = spawn(moved, draws[i]);
+    boards[i] = b;
+    rewards[i] = score;
+
+    bool over = true;
+    for (int action = 0; action < 4 && over; action++) {
+        long long unused = 0;
+        over = move(b, action, row_left, row_right, row_score, &unused) == b;
+    }
+    done[i] = over;
+}
+"""
+
+_THREADS_PER_BLOCK = 256
+_device_state = None
+
+
+def _get_device_state():
+    """Compile the kernel and upload the row tables once per process."""
+    global _device_state
+    if cp is None:
+        raise ImportError("step_batch_gpu requires cupy (pip install rl-2048[gpu])")
+    if _device_state is None:
+        kernel = cp.RawKernel(_KERNEL_SOURCE, "step_batch")
+        tables = tuple(cp.asarray(t) for t in (ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE))
+        _device_state = kernel, tables
+    return _device_state
+
+
+def step_batch_gpu(
+    boards, actions, dones=None, draws=None
+) -> Tuple["cp.ndarray", "cp.ndarray", "cp.ndarray"]:
+    """
+    Step N bitboard games on the GPU in place.
+
+    Follows ``BatchGame2048.step``: invalid actions leave a board unchanged
+    with zero reward, and finished games are frozen. Spawns use one uniform
+    draw per game with the same rule as the CPU kernels, so the same draws
+    give the same boards.
+
+    Args:
+        boards: (N,) uint64 device array of bitboards, updated in place
+            (e.g. ``cupy.asarray(BatchGame2048(...).bitboards)``)
+        actions: (N,) integer actions (0=UP, 1=RIGHT, 2=DOWN, 3=LEFT)
+        dones: Optional (N,) bool device array of finished games, updated in place
+        draws: Optional (N,) float64 uniform draws in [0, 1); drawn with
+            ``cupy.random`` when omitted
+
+    Returns:
+        Tuple of (boards, rewards, dones) as device arrays
+    """
+    kernel, (row_left, row_right, row_score) = _get_device_state()
+    if boards.dtype != np.uint64 or boards.ndim != 1:
+        raise ValueError(f"Expected (N,) uint64 boards, got {boards.shape} {boards.dtype}")
+    n = boards.shape[0]
+
+    actions = cp.asarray(actions)
+    if actions.shape != (n,):
+        raise ValueError(f"Expected actions of shape {(n,)}, got {actions.shape}")
+    # Checked before the uint8 cast, which would turn -1 into 255
+    if not bool(((actions >= 0) & (actions < 4)).all()):
+        raise ValueError("Actions must be in 0-3")
+    actions = actions.astype(cp.uint8, copy=False)
+    if dones is None:
+        dones = cp.zeros(n, dtype=cp.bool_)
+    draws = cp.random.random(n) if draws is None else cp.asarray(draws, dtype=cp.float64)
+    rewards = cp.empty(n, dtype=cp.int64)
+
+    blocks = (n + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+    kernel(
+        (blocks,),
+        (_THREADS_PER_BLOCK,),
+        (boards, actions, draws, row_left, row_right, row_score, rewards, dones, np.int32(n)),
+    )
+    return boards, rewards, dones
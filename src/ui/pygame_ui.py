@@ -1,12 +1,16 @@
 """Pygame-based visual interface for 2048."""
 
-from typing import Callable, Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pygame
 
 from ..game import Action, Game2048
 
+# How often run_agent_game polls window events while waiting between moves
+_EVENT_POLL_INTERVAL_S = 0.005
+
 # Color scheme
 COLORS = {
     "background": (187, 173, 160),
@@ -75,6 +79,11 @@ class PygameUI:
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
 
+        # Rendered text is cached: tile labels by value, the header by game state
+        self._text_cache: Dict[int, pygame.Surface] = {}
+        self._header_cache: Optional[Tuple[tuple, List[Tuple[pygame.Surface, pygame.Rect]]]] = None
+        self._drawn_state: Optional[tuple] = None
+
     def run_human_game(self):
         """
         Run game with human player controls.
@@ -89,7 +98,9 @@ class PygameUI:
         while running:
             # Handle events
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._drawn_state = None
+                elif event.type == pygame.QUIT:
                     running = False
 
                 elif event.type == pygame.KEYDOWN:
@@ -142,11 +153,14 @@ class PygameUI:
         paused = False
         step = 0
         auto_play = True
+        next_move = time.monotonic()
 
         while running:
             # Handle events
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._drawn_state = None
+                elif event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
@@ -159,10 +173,12 @@ class PygameUI:
                     elif event.key in (pygame.K_q, pygame.K_ESCAPE):
                         running = False
 
-            # Execute agent action if not paused
-            if not paused and auto_play and not self.game.is_game_over():
+            # Execute agent action once the move delay has elapsed, if not paused
+            now = time.monotonic()
+            if now >= next_move and not paused and auto_play and not self.game.is_game_over():
+                next_move = now + delay_ms / 1000
                 if max_steps is None or step < max_steps:
-                    action = get_action(self.game.board.copy())
+                    action = get_action(self.game.board)
                     if self.game.is_valid_action(action):
                         board, reward, done = self.game.step(action)
                         step += 1
@@ -173,15 +189,31 @@ class PygameUI:
                     else:
                         print(f"Agent selected invalid action: {action}")
 
-            # Draw
+            # Draw (a no-op while nothing changed), then sleep in short slices
+            # until the next move so the window keeps handling events
             self.draw()
-            pygame.time.wait(delay_ms)
-            self.clock.tick(self.fps)
+            remaining = next_move - time.monotonic()
+            time.sleep(
+                min(_EVENT_POLL_INTERVAL_S, remaining) if remaining > 0 else _EVENT_POLL_INTERVAL_S
+            )
 
         pygame.quit()
 
-    def draw(self):
-        """Draw the current game state."""
+    def draw(self, force: bool = False):
+        """
+        Draw the current game state.
+
+        Skipped when neither the game state nor the window changed since the
+        last frame.
+
+        Args:
+            force: Redraw even if nothing changed
+        """
+        state = (self.game.board.tobytes(), self.game.score, self.game.max_tile)
+        if not force and state == self._drawn_state:
+            return
+        self._drawn_state = state
+
         self.screen.fill(COLORS["background"])
 
         # Draw header
@@ -194,18 +226,28 @@ class PygameUI:
 
     def _draw_header(self):
         """Draw score and info header."""
+        game_over = self.game.is_game_over()
+        key = (self.game.score, self.game.max_tile, game_over, game_over and self.game.has_won())
+        if self._header_cache is None or self._header_cache[0] != key:
+            self._header_cache = (key, self._render_header(game_over))
+
+        for surface, rect in self._header_cache[1]:
+            self.screen.blit(surface, rect)
+
+    def _render_header(self, game_over: bool) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Render the header text surfaces and their positions."""
         # Score
         score_text = self.font_medium.render(f"Score: {self.game.score}", True, COLORS["text_dark"])
-        self.screen.blit(score_text, (20, 20))
+        surfaces = [(score_text, score_text.get_rect(topleft=(20, 20)))]
 
         # Max tile
         max_tile_text = self.font_small.render(
             f"Max: {self.game.max_tile}", True, COLORS["text_dark"]
         )
-        self.screen.blit(max_tile_text, (20, 60))
+        surfaces.append((max_tile_text, max_tile_text.get_rect(topleft=(20, 60))))
 
         # Game over / won message
-        if self.game.is_game_over():
+        if game_over:
             if self.game.has_won():
                 msg = "You Win!"
                 color = (0, 200, 0)
@@ -214,14 +256,16 @@ class PygameUI:
                 color = (200, 0, 0)
 
             text = self.font_large.render(msg, True, color)
-            text_rect = text.get_rect(center=(self.width - 150, 45))
-            self.screen.blit(text, text_rect)
+            surfaces.append((text, text.get_rect(center=(self.width - 150, 45))))
+
+        return surfaces
 
     def _draw_board(self):
         """Draw the game board."""
+        board = self.game.board
         for i in range(self.game.size):
             for j in range(self.game.size):
-                value = self.game.board[i, j]
+                value = board[i, j]
                 self._draw_cell(i, j, value)
 
     def _draw_cell(self, row: int, col: int, value: int):
@@ -252,6 +296,22 @@ class PygameUI:
 
         # Draw value
         if value > 0:
+            text = self._tile_text(int(value))
+            text_rect = text.get_rect(center=(x + self.cell_size // 2, y + self.cell_size // 2))
+            self.screen.blit(text, text_rect)
+
+    def _tile_text(self, value: int) -> pygame.Surface:
+        """
+        Return the rendered label for a tile value, rendering it on first use.
+
+        Args:
+            value: Tile value
+
+        Returns:
+            Cached text surface
+        """
+        text = self._text_cache.get(value)
+        if text is None:
             # Choose text color
             text_color = COLORS["text_light"] if value > 4 else COLORS["text_dark"]
 
@@ -262,8 +322,8 @@ class PygameUI:
                 font = self.font_medium
 
             text = font.render(str(value), True, text_color)
-            text_rect = text.get_rect(center=(x + self.cell_size // 2, y + self.cell_size // 2))
-            self.screen.blit(text, text_rect)
+            self._text_cache[value] = text
+        return text
 
     def close(self):
         """Clean up pygame resources."""
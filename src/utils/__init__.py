@@ -1,6 +1,6 @@
 """Utilities for training, logging, and model management."""
 
-from .checkpoint import ModelCheckpoint
+from .checkpoint import ModelCheckpoint, load_checkpoint
 from .logger import MLFlowLogger
 
-__all__ = ["ModelCheckpoint", "MLFlowLogger"]
+__all__ = ["ModelCheckpoint", "MLFlowLogger", "load_checkpoint"]
@@ -1,17 +1,336 @@
 """Model checkpointing utilities."""
 
+import hashlib
+import io
 import json
+import os
+import pickle
+import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import torch
 
+# Protocol 2 (torch's default): weights_only loading rejects the FRAME opcode
+# used by protocols 4+, and tensor bytes live outside the pickle anyway
+_PICKLE_PROTOCOL = 2
+
+# Slice of tensor bytes hashed at a time when deduplicating checkpoints
+_HASH_CHUNK_BYTES = 4 << 20
+
+# Frame header that starts every zstd stream
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+
+def _link_or_copy(source: Path, target: Path):
+    """
+    Make ``target`` a hardlink to ``source``, atomically replacing any old file.
+
+    Falls back to a file copy on filesystems without hardlink support.
+
+    Args:
+        source: Existing file
+        target: Path to create or replace
+    """
+    staging = target.with_name(target.name + ".tmp")
+    staging.unlink(missing_ok=True)
+    try:
+        os.link(source, staging)
+    except OSError:
+        shutil.copyfile(source, staging)
+    os.replace(staging, target)
+
+
+def _save_atomic(obj: Any, path: Path, compress: bool = False):
+    """
+    ``torch.save`` to a temporary file and rename it over ``path``.
+
+    The rename gives ``path`` a fresh inode, so hardlinks to the previous file
+    keep their contents. The zipfile container is kept explicitly since
+    ``torch.load(mmap=True)`` needs it, and a path is passed rather than a
+    Python file object so torch writes the records from C++.
+
+    Args:
+        obj: Object to save
+        path: Destination path
+        compress: Stream the file through a multi-threaded zstd compressor
+    """
+    staging_path = path.with_name(path.name + ".tmp")
+    if compress:
+        compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+        with open(staging_path, "wb") as raw, compressor.stream_writer(raw) as f:
+            torch.save(obj, f, pickle_protocol=_PICKLE_PROTOCOL)
+    else:
+        torch.save(
+            obj,
+            staging_path,
+            pickle_protocol=_PICKLE_PROTOCOL,
+            _use_new_zipfile_serialization=True,
+        )
+    os.replace(staging_path, path)
+
+
+def _load_file(path: Path, map_location: str) -> Any:
+    """
+    ``torch.load`` a file written by ``_save_atomic``, compressed or not.
+
+    Compression is detected from the zstd frame header, so best/latest links
+    and explicit paths load whatever their suffix. Uncompressed files are
+    memory-mapped, so tensors are paged in from disk instead of read up front.
+    Checkpoints only hold tensors and plain Python data, so both kinds load
+    with ``weights_only``.
+
+    Args:
+        path: File to load
+        map_location: Device to map tensors to
+
+    Returns:
+        Loaded object
+    """
+    with open(path, "rb") as f:
+        compressed = f.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC
+        if compressed:
+            if zstandard is None:
+                raise ImportError(
+                    "compressed checkpoints require zstandard (pip install rl-2048[zstd])"
+                )
+            f.seek(0)
+            # The zip container needs random access, so decompress into memory
+            buffer = io.BytesIO(zstandard.ZstdDecompressor().stream_reader(f).read())
+    if not compressed:
+        try:
+            return torch.load(path, map_location=map_location, mmap=True, weights_only=True)
+        except TypeError:  # pragma: no cover - torch < 2.1 has no mmap
+            return torch.load(path, map_location=map_location, weights_only=True)
+    return torch.load(buffer, map_location=map_location, weights_only=True)
+
+
+def _stage_on_cpu(obj: Any) -> Any:
+    """
+    Snapshot a checkpoint for a background write.
+
+    Tensors are copied to CPU and containers rebuilt, so training can keep
+    updating the live parameters and optimizer state while the copy is saved.
+
+    Args:
+        obj: Checkpoint dict or any value inside it
+
+    Returns:
+        Snapshot sharing no mutable tensors or containers with ``obj``
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().to("cpu", copy=True)
+    if isinstance(obj, dict):
+        return {key: _stage_on_cpu(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_stage_on_cpu(value) for value in obj)
+    return obj
+
+
+def _tensor_bytes(tensor: torch.Tensor) -> np.ndarray:
+    """Copy a tensor's raw bytes into a flat uint8 array."""
+    return tensor.detach().cpu().contiguous().view(-1).view(torch.uint8).numpy().copy()
+
+
+def _state_digest(state_dict: Dict[str, Any]) -> str:
+    """
+    Hash the names, dtypes, shapes and bytes of a model state dict.
+
+    Tensor bytes are fed to the hash in ``_HASH_CHUNK_BYTES`` slices of a
+    uint8 view, so CPU tensors are hashed in place and device tensors are
+    copied to the host one slice at a time.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for key, value in state_dict.items():
+        digest.update(key.encode())
+        if isinstance(value, torch.Tensor):
+            digest.update(f"{value.dtype}{tuple(value.shape)}".encode())
+            raw = value.detach().contiguous().view(-1).view(torch.uint8)
+            for start in range(0, raw.numel(), _HASH_CHUNK_BYTES):
+                digest.update(raw[start : start + _HASH_CHUNK_BYTES].cpu().numpy())
+        else:
+            digest.update(pickle.dumps(value, protocol=_PICKLE_PROTOCOL))
+    return digest.hexdigest()
+
+
+def _split_state_dict(state_dict: Dict[str, Any], num_shards: int) -> List[Dict[str, Any]]:
+    """
+    Split a state dict into shards along top-level module names.
+
+    Keys sharing their first dotted component stay together; groups are
+    assigned largest first to the lightest shard to balance bytes.
+
+    Args:
+        state_dict: Model state dict
+        num_shards: Maximum number of shards
+
+    Returns:
+        Non-empty shard dicts
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    for key, value in state_dict.items():
+        groups.setdefault(key.split(".", 1)[0], {})[key] = value
+
+    def nbytes(group: Dict[str, Any]) -> int:
+        return sum(
+            value.numel() * value.element_size()
+            for value in group.values()
+            if isinstance(value, torch.Tensor)
+        )
+
+    shards: List[Dict[str, Any]] = [{} for _ in range(min(num_shards, len(groups)))]
+    sizes = [0] * len(shards)
+    for group in sorted(groups.values(), key=nbytes, reverse=True):
+        lightest = sizes.index(min(sizes))
+        shards[lightest].update(group)
+        sizes[lightest] += nbytes(group)
+    return shards
+
+
+def _read_checkpoint(checkpoint_path: Path, device: str) -> Dict[str, Any]:
+    """
+    Load a checkpoint file and merge its shards (if any) back in.
+
+    Args:
+        checkpoint_path: Checkpoint file
+        device: Device to map tensors to
+
+    Returns:
+        Checkpoint dict with the model state in ``model_state_dict``
+    """
+    checkpoint = _load_file(checkpoint_path, device)
+    manifest = checkpoint.pop("model_shards", None)
+    if manifest is None:
+        return checkpoint
+
+    def read(name):
+        shard_path = checkpoint_path.parent / name
+        if not shard_path.exists():
+            raise FileNotFoundError(f"Checkpoint shard not found: {shard_path}")
+        shard = _load_file(shard_path, device)
+        if shard["token"] != manifest["token"]:
+            raise ValueError(f"Checkpoint shard was overwritten: {shard_path}")
+        return shard["state"]
+
+    state = dict(checkpoint["model_state_dict"])
+    with ThreadPoolExecutor(max_workers=max(len(manifest["files"]), 1)) as pool:
+        for shard in pool.map(read, manifest["files"]):
+            state.update(shard)
+    checkpoint["model_state_dict"] = state
+    return checkpoint
+
+
+def _decode_model_state(checkpoint: Dict[str, Any], checkpoint_dir: Path) -> Dict[str, Any]:
+    """
+    Rebuild the full model state dict of a checkpoint, replaying any deltas
+    and following dedup references.
+
+    Args:
+        checkpoint: Loaded checkpoint dict
+        checkpoint_dir: Directory holding the checkpoint and its bases
+
+    Returns:
+        Model state dict
+    """
+    reference = checkpoint.get("model_state_ref")
+    if reference is not None:
+        target_path = checkpoint_dir / reference["file"]
+        if not target_path.exists():
+            raise FileNotFoundError(f"Referenced checkpoint not found: {target_path}")
+        target = _read_checkpoint(target_path, "cpu")
+        if target.get("file_token") != reference["token"]:
+            raise ValueError(f"Referenced checkpoint was overwritten: {target_path}")
+        return _decode_model_state(target, checkpoint_dir)
+
+    delta = checkpoint.get("model_delta")
+    state = dict(checkpoint["model_state_dict"])
+    if delta is None:
+        return state
+    if zstandard is None:
+        raise ImportError("delta checkpoints require zstandard (pip install rl-2048[zstd])")
+
+    base_path = checkpoint_dir / delta["base_file"]
+    if not base_path.exists():
+        raise FileNotFoundError(f"Delta base checkpoint not found: {base_path}")
+    base = _read_checkpoint(base_path, "cpu")
+    if base.get("file_token") != delta["base_token"]:
+        raise ValueError(f"Delta base checkpoint was overwritten: {base_path}")
+    base_state = _decode_model_state(base, checkpoint_dir)
+
+    decompressor = zstandard.ZstdDecompressor()
+    for key, (dtype, shape, payload) in delta["tensors"].items():
+        diff = np.frombuffer(decompressor.decompress(payload), dtype=np.uint8)
+        raw = np.bitwise_xor(_tensor_bytes(base_state[key]), diff)
+        state[key] = torch.from_numpy(raw).view(dtype).reshape(shape)
+    return state
+
+
+def load_checkpoint(checkpoint_path: str, device: str = "cpu") -> Dict[str, Any]:
+    """
+    Load a checkpoint file written by ``ModelCheckpoint`` into a plain dict.
+
+    Shards are merged, deltas replayed and dedup references followed, so
+    ``model_state_dict`` holds the full model state whichever storage options
+    wrote the file. Files saved directly with ``torch.save`` load as they are.
+
+    Args:
+        checkpoint_path: Checkpoint file
+        device: Device to map tensors to
+
+    Returns:
+        Checkpoint dictionary
+    """
+    checkpoint_path = Path(checkpoint_path)
+    checkpoint = _read_checkpoint(checkpoint_path, device)
+    if "model_delta" in checkpoint or "model_state_ref" in checkpoint:
+        state = _decode_model_state(checkpoint, checkpoint_path.parent)
+        checkpoint["model_state_dict"] = {
+            key: value.to(device) if isinstance(value, torch.Tensor) else value
+            for key, value in state.items()
+        }
+        checkpoint.pop("model_delta", None)
+        checkpoint.pop("model_state_ref", None)
+    return checkpoint
+
 
 class ModelCheckpoint:
     """
     Handles saving and loading of model checkpoints.
 
     Supports saving best model based on a metric and periodic checkpoints.
+    With ``async_save`` the file writes run on a background thread; call
+    ``close()`` (or use the manager as a context manager) to flush them.
+
+    With ``delta_anchor_interval`` model tensors are stored as zstd-compressed
+    XOR deltas against the previous save, with a full "anchor" checkpoint
+    every ``delta_anchor_interval`` saves. Weights change little between
+    epochs, so the deltas are mostly zero bytes and compress well. A delta
+    file needs the files back to its anchor, and epochs must be saved in
+    increasing order (saving an older epoch again starts a new anchor).
+
+    With ``dtype="bf16"`` epoch and best files store floating-point weights in
+    bfloat16, halving their size. The latest file stays full precision so
+    training resumes exactly.
+
+    With ``num_shards`` the model state is split by top-level module into
+    ``<epoch file>.shard<i>.pt`` files written and read by parallel threads.
+    The epoch file keeps everything else plus the shard manifest, so best and
+    latest still link to it.
+
+    With ``compress`` every file is streamed through zstd and named
+    ``*.pt.zst``; ``load`` detects compressed files by content.
+
+    With ``keep_last_k`` only the newest ``k`` epoch files written by this
+    manager are kept (plus any that a kept, best or latest file still needs as
+    a delta base or for its shards); best and latest are never deleted.
     """
 
     def __init__(
@@ -21,6 +340,13 @@ class ModelCheckpoint:
         save_best: bool = True,
         mode: str = "max",
         verbose: bool = True,
+        async_save: bool = False,
+        delta_anchor_interval: Optional[int] = None,
+        dtype: Optional[str] = None,
+        num_shards: Optional[int] = None,
+        keep_last_k: Optional[int] = None,
+        compress: bool = False,
+        dedup: bool = False,
     ):
         """
         Initialize checkpoint manager.
@@ -31,6 +357,25 @@ class ModelCheckpoint:
             save_best: Whether to track and save best model
             mode: "max" or "min" for best model tracking
             verbose: Whether to print save messages
+            async_save: Write checkpoints on a background thread. ``save``
+                returns once the state is copied to CPU; each save waits for
+                the previous write to finish.
+            delta_anchor_interval: Store model tensors as compressed deltas
+                against the previous save, writing a full checkpoint every this
+                many saves. ``None`` stores every checkpoint in full. Requires
+                ``zstandard`` (``pip install rl-2048[zstd]``).
+            dtype: ``"bf16"`` to store epoch/best weights in bfloat16, or
+                ``None`` to keep the model's own dtypes
+            num_shards: Write the model state as up to this many shard files in
+                parallel. ``None`` keeps it inside the epoch file. Delta files
+                keep their compressed deltas inside the epoch file, so with
+                ``delta_anchor_interval`` only anchors are sharded.
+            keep_last_k: Delete older epoch files once this many newer ones
+                exist. ``None`` keeps every epoch file.
+            compress: Write checkpoints as zstd-compressed ``.pt.zst`` files.
+                Requires ``zstandard``.
+            dedup: When the model state matches an earlier epoch file byte for
+                byte, store a reference to that file instead of the tensors
         """
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
@@ -42,6 +387,62 @@ class ModelCheckpoint:
         self.best_metric = float("-inf") if mode == "max" else float("inf")
         self.best_epoch = 0
 
+        self.async_save = async_save
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+        # Pinned CPU copies of CUDA model tensors, reused across saves
+        self._pinned_mirror: Dict[str, torch.Tensor] = {}
+
+        if delta_anchor_interval is not None:
+            if delta_anchor_interval < 1:
+                raise ValueError("delta_anchor_interval must be at least 1")
+            if zstandard is None:
+                raise ImportError("delta checkpoints require zstandard (pip install rl-2048[zstd])")
+        self.delta_anchor_interval = delta_anchor_interval
+        # Raw bytes of the last written model tensors, the base for the next delta
+        self._prev_flat: Dict[str, Tuple[torch.dtype, torch.Size, np.ndarray]] = {}
+        self._prev_path: Optional[Path] = None
+        self._prev_epoch: Optional[int] = None
+        self._prev_token: Optional[str] = None
+        self._saves_since_anchor = 0
+        # Epoch file -> the epoch file its delta (or dedup reference) points at
+        self._delta_bases: Dict[Path, Path] = {}
+
+        if dtype not in (None, "bf16"):
+            raise ValueError(f"Unsupported checkpoint dtype: {dtype}")
+        self.dtype = dtype
+
+        if num_shards is not None and num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        self.num_shards = num_shards
+
+        if keep_last_k is not None and keep_last_k < 1:
+            raise ValueError("keep_last_k must be at least 1")
+        self.keep_last_k = keep_last_k
+
+        if compress and zstandard is None:
+            raise ImportError(
+                "compressed checkpoints require zstandard (pip install rl-2048[zstd])"
+            )
+        self.compress = compress
+        self._suffix = ".pt.zst" if compress else ".pt"
+        # File names are fixed per manager, so build them once
+        self._epoch_name = f"{filename_prefix}_epoch_{{}}{self._suffix}"
+        self._best_path = self.save_dir / f"{filename_prefix}_best{self._suffix}"
+        self._latest_path = self.save_dir / f"{filename_prefix}_latest{self._suffix}"
+
+        self.dedup = dedup
+        # Model state digest -> (epoch file holding that state, its file token)
+        self._seen: Dict[str, Tuple[Path, str]] = {}
+
+        # Digest of the last JSON written per config file
+        self._config_hashes: Dict[str, str] = {}
+        # Epoch files written by this manager, oldest first, and evicted ones
+        # still needed by another file
+        self._epoch_files: Deque[Path] = deque()
+        self._evicted: List[Path] = []
+        self._best_source: Optional[Path] = None
+
     def save(
         self,
         model: torch.nn.Module,
@@ -63,8 +464,11 @@ class ModelCheckpoint:
             is_best: Force saving as best model
 
         Returns:
-            Path to saved checkpoint
+            Path to saved checkpoint (still being written when ``async_save``)
         """
+        # Keep writes ordered and surface errors from the previous one
+        self.wait()
+
         # Check if this is the best model
         if metric is not None and self.save_best:
             if self.mode == "max":
@@ -79,7 +483,7 @@ class ModelCheckpoint:
         # Prepare checkpoint data
         checkpoint = {
             "epoch": epoch,
-            "model_state_dict": model.state_dict(),
+            "model_state_dict": self._stage_model_state(model.state_dict()),
             "best_metric": self.best_metric,
             "best_epoch": self.best_epoch,
         }
@@ -93,25 +497,312 @@ class ModelCheckpoint:
         if metadata is not None:
             checkpoint["metadata"] = metadata
 
-        # Save checkpoint
-        checkpoint_path = self.save_dir / f"{self.filename_prefix}_epoch_{epoch}.pt"
-        torch.save(checkpoint, checkpoint_path)
+        checkpoint_path = self.save_dir / self._epoch_name.format(epoch)
+        if self.async_save:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+            # The model state is already staged; snapshot the rest
+            staged = {
+                key: value if key == "model_state_dict" else _stage_on_cpu(value)
+                for key, value in checkpoint.items()
+            }
+            self._pending = self._executor.submit(
+                self._write, staged, checkpoint_path, is_best, metric
+            )
+        else:
+            self._write(checkpoint, checkpoint_path, is_best, metric)
+
+        return str(checkpoint_path)
+
+    def _stage_model_state(self, state_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a model state dict off the GPU for saving.
+
+        CUDA tensors are copied into a persistent pinned-memory mirror with
+        non-blocking transfers and one synchronize, instead of a pageable copy
+        per tensor inside ``torch.save``. Buffers (e.g. BatchNorm statistics)
+        are refreshed like parameters. With ``async_save`` every other entry is
+        snapshotted too; otherwise CPU entries are saved as they are.
+
+        Args:
+            state_dict: Model state dict
+
+        Returns:
+            State dict safe to hand to ``torch.save``
+        """
+        staged = {}
+        copied_from_cuda = False
+        for key, value in state_dict.items():
+            if isinstance(value, torch.Tensor) and value.is_cuda:
+                mirror = self._pinned_mirror.get(key)
+                if mirror is None or mirror.shape != value.shape or mirror.dtype != value.dtype:
+                    mirror = torch.empty(value.shape, dtype=value.dtype, pin_memory=True)
+                    self._pinned_mirror[key] = mirror
+                mirror.copy_(value, non_blocking=True)
+                staged[key] = mirror
+                copied_from_cuda = True
+            elif self.async_save:
+                staged[key] = _stage_on_cpu(value)
+            else:
+                staged[key] = value
+        if copied_from_cuda:
+            torch.cuda.synchronize()
+        return staged
+
+    def _write(
+        self,
+        checkpoint: Dict[str, Any],
+        checkpoint_path: Path,
+        is_best: bool,
+        metric: Optional[float],
+    ):
+        """
+        Write a checkpoint file and point the best/latest files at it.
+
+        Epoch and best files hold the model only. Optimizer state is needed
+        just to resume training, so it is written to the latest file alone.
+        """
+        model_checkpoint = {
+            key: value for key, value in checkpoint.items() if key != "optimizer_state_dict"
+        }
+        if self.dtype == "bf16":
+            model_checkpoint["model_state_dict"] = {
+                key: (
+                    value.to(torch.bfloat16)
+                    if isinstance(value, torch.Tensor) and value.is_floating_point()
+                    else value
+                )
+                for key, value in checkpoint["model_state_dict"].items()
+            }
+        if self.delta_anchor_interval is not None or self.dedup:
+            # Names the file's contents: a delta is only valid against the base
+            # (or reference) was taken from, not a later file of the same name
+            model_checkpoint["file_token"] = os.urandom(8).hex()
+        reference = self._find_duplicate(model_checkpoint, checkpoint_path) if self.dedup else None
+        if reference is not None:
+            model_checkpoint["model_state_dict"] = {}
+            model_checkpoint["model_state_ref"] = reference
+        else:
+            if self.delta_anchor_interval is not None:
+                model_checkpoint = self._encode_delta(model_checkpoint, checkpoint_path)
+            if self.num_shards is not None:
+                model_checkpoint = self._write_shards(model_checkpoint, checkpoint_path)
+
+        # Atomic writes mean re-saving an epoch never rewrites the contents of
+        # best/latest links that point at the previous file
+        _save_atomic(model_checkpoint, checkpoint_path, self.compress)
 
         if self.verbose:
             print(f"Saved checkpoint: {checkpoint_path}")
 
-        # Save best model
+        # Best (and latest, when it matches the epoch file) are hardlinks to it
         if is_best:
-            best_path = self.save_dir / f"{self.filename_prefix}_best.pt"
-            torch.save(checkpoint, best_path)
+            best_path = self._best_path
+            _link_or_copy(checkpoint_path, best_path)
+            self._best_source = checkpoint_path
             if self.verbose:
                 print(f"Saved best model: {best_path} (metric: {metric})")
 
-        # Save latest checkpoint link
-        latest_path = self.save_dir / f"{self.filename_prefix}_latest.pt"
-        torch.save(checkpoint, latest_path)
+        latest_path = self._latest_path
+        if self.dtype is not None:
+            # Full precision (and no delta) for exact resume
+            _save_atomic(checkpoint, latest_path, self.compress)
+        elif "optimizer_state_dict" in checkpoint:
+            full_checkpoint = dict(model_checkpoint)
+            full_checkpoint["optimizer_state_dict"] = checkpoint["optimizer_state_dict"]
+            _save_atomic(full_checkpoint, latest_path, self.compress)
+        else:
+            _link_or_copy(checkpoint_path, latest_path)
 
-        return str(checkpoint_path)
+        if self.keep_last_k is not None:
+            self._rotate(checkpoint_path)
+
+    def _rotate(self, checkpoint_path: Path):
+        """
+        Record a new epoch file and delete epoch files beyond ``keep_last_k``.
+
+        Delta bases, dedup targets and shard files are referenced by name, so an evicted file
+        that a kept, best or latest file depends on is kept until it is not.
+
+        Args:
+            checkpoint_path: Epoch file just written
+        """
+        if checkpoint_path in self._epoch_files:
+            self._epoch_files.remove(checkpoint_path)
+        if checkpoint_path in self._evicted:
+            self._evicted.remove(checkpoint_path)
+        self._epoch_files.append(checkpoint_path)
+        while len(self._epoch_files) > self.keep_last_k:
+            self._evicted.append(self._epoch_files.popleft())
+
+        # Without deltas or shards, best/latest hardlinks keep their own inode alive
+        roots = list(self._epoch_files)
+        if self._best_source is not None and (
+            self.delta_anchor_interval is not None or self.num_shards is not None or self.dedup
+        ):
+            roots.append(self._best_source)
+        needed: Set[Path] = set()
+        for path in roots:
+            while path is not None and path not in needed:
+                needed.add(path)
+                path = self._delta_bases.get(path)
+
+        for path in [path for path in self._evicted if path not in needed]:
+            for shard in path.parent.glob(f"{path.name}.shard*"):
+                shard.unlink(missing_ok=True)
+            path.unlink(missing_ok=True)
+            self._delta_bases.pop(path, None)
+            self._forget(path)
+            self._evicted.remove(path)
+
+    def _write_shards(self, checkpoint: Dict[str, Any], checkpoint_path: Path) -> Dict[str, Any]:
+        """
+        Write the model state to shard files in parallel.
+
+        Args:
+            checkpoint: Checkpoint dict about to be written
+            checkpoint_path: Path the checkpoint will be written to
+
+        Returns:
+            Checkpoint dict with the model state replaced by a shard manifest
+        """
+        shards = _split_state_dict(checkpoint["model_state_dict"], self.num_shards)
+        # Shard files are reused when an epoch is saved again; the token lets
+        # load() detect best/latest files whose shards were overwritten since
+        token = os.urandom(8).hex()
+        files = {
+            f"{checkpoint_path.name}.shard{i}{self._suffix}": shard
+            for i, shard in enumerate(shards)
+        }
+
+        def write(item):
+            name, shard = item
+            _save_atomic({"token": token, "state": shard}, self.save_dir / name, self.compress)
+
+        if files:
+            with ThreadPoolExecutor(max_workers=len(files)) as pool:
+                list(pool.map(write, files.items()))
+
+        checkpoint = dict(checkpoint)
+        checkpoint["model_state_dict"] = {}
+        checkpoint["model_shards"] = {
+            "token": token,
+            "files": {name: list(shard) for name, shard in files.items()},
+        }
+        return checkpoint
+
+    def _find_duplicate(
+        self, checkpoint: Dict[str, Any], checkpoint_path: Path
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up an earlier epoch file holding the same model state.
+
+        Records the state's digest against ``checkpoint_path`` when there is
+        no such file.
+
+        Args:
+            checkpoint: Checkpoint dict about to be written
+            checkpoint_path: Path the checkpoint will be written to
+
+        Returns:
+            Reference to store in place of the model state, or None
+        """
+        # The file about to be overwritten can no longer serve as a target
+        self._forget(checkpoint_path)
+        digest = _state_digest(checkpoint["model_state_dict"])
+        seen = self._seen.get(digest)
+        if seen is not None and seen[0].exists():
+            self._delta_bases[checkpoint_path] = seen[0]
+            return {"file": seen[0].name, "token": seen[1]}
+
+        self._seen[digest] = (checkpoint_path, checkpoint["file_token"])
+        self._delta_bases.pop(checkpoint_path, None)
+        return None
+
+    def _forget(self, path: Path):
+        """Drop dedup digests recorded for an epoch file."""
+        for digest in [digest for digest, (seen, _) in self._seen.items() if seen == path]:
+            del self._seen[digest]
+
+    def _encode_delta(self, checkpoint: Dict[str, Any], checkpoint_path: Path) -> Dict[str, Any]:
+        """
+        Replace model tensors with compressed XOR deltas against the last save.
+
+        Tensors without a same-shaped predecessor, and non-tensor entries, stay
+        in ``model_state_dict`` as they are. Anchors are written unchanged.
+
+        Args:
+            checkpoint: Checkpoint dict about to be written
+            checkpoint_path: Path the checkpoint will be written to
+
+        Returns:
+            Checkpoint dict to write
+        """
+        epoch = checkpoint["epoch"]
+        is_anchor = (
+            self._prev_path is None
+            or self._saves_since_anchor >= self.delta_anchor_interval
+            or epoch <= self._prev_epoch
+        )
+
+        state = checkpoint["model_state_dict"]
+        flat = {
+            key: (value.dtype, value.shape, _tensor_bytes(value))
+            for key, value in state.items()
+            if isinstance(value, torch.Tensor)
+        }
+
+        if not is_anchor:
+            compressor = zstandard.ZstdCompressor(level=3)
+            full_state = {}
+            tensors = {}
+            for key, value in state.items():
+                previous = self._prev_flat.get(key)
+                if key not in flat or previous is None or previous[:2] != flat[key][:2]:
+                    full_state[key] = value
+                    continue
+                delta = np.bitwise_xor(flat[key][2], previous[2])
+                tensors[key] = (value.dtype, tuple(value.shape), compressor.compress(delta))
+
+            checkpoint = dict(checkpoint)
+            checkpoint["model_state_dict"] = full_state
+            checkpoint["model_delta"] = {
+                "base_token": self._prev_token,
+                "base_file": self._prev_path.name,
+                "tensors": tensors,
+            }
+
+        if is_anchor:
+            self._delta_bases.pop(checkpoint_path, None)
+        else:
+            self._delta_bases[checkpoint_path] = self._prev_path
+        self._prev_flat = flat
+        self._prev_path = checkpoint_path
+        self._prev_epoch = epoch
+        self._prev_token = checkpoint["file_token"]
+        self._saves_since_anchor = 1 if is_anchor else self._saves_since_anchor + 1
+        return checkpoint
+
+    def wait(self):
+        """Block until the pending background write (if any) has finished."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self):
+        """Flush the pending write and stop the background writer thread."""
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
 
     def load(
         self,
@@ -120,26 +811,34 @@ class ModelCheckpoint:
         load_best: bool = False,
         optimizer: Optional[torch.optim.Optimizer] = None,
         device: str = "cpu",
+        require_optimizer: bool = False,
     ) -> Dict[str, Any]:
         """
         Load model checkpoint.
 
+        Only the latest checkpoint carries optimizer state; epoch and best
+        checkpoints restore the model alone.
+
         Args:
             model: Model to load weights into
             checkpoint_path: Path to checkpoint (or None to load latest/best)
             load_best: Load best model instead of latest
             optimizer: Optional optimizer to load state into
             device: Device to load model to
+            require_optimizer: Raise if ``optimizer`` is given but the
+                checkpoint has no optimizer state, instead of skipping it
 
         Returns:
             Checkpoint dictionary with metadata
         """
+        self.wait()
+
         # Determine checkpoint path
         if checkpoint_path is None:
             if load_best:
-                checkpoint_path = self.save_dir / f"{self.filename_prefix}_best.pt"
+                checkpoint_path = self._best_path
             else:
-                checkpoint_path = self.save_dir / f"{self.filename_prefix}_latest.pt"
+                checkpoint_path = self._latest_path
         else:
             checkpoint_path = Path(checkpoint_path)
 
@@ -147,11 +846,17 @@ class ModelCheckpoint:
             raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
 
         # Load checkpoint
-        checkpoint = torch.load(checkpoint_path, map_location=device)
+        checkpoint = load_checkpoint(checkpoint_path, device)
         model.load_state_dict(checkpoint["model_state_dict"])
 
-        if optimizer is not None and "optimizer_state_dict" in checkpoint:
-            optimizer.load_state_dict(checkpoint["optimizer_state_dict"])
+        if optimizer is not None:
+            if "optimizer_state_dict" in checkpoint:
+                optimizer.load_state_dict(checkpoint["optimizer_state_dict"])
+            elif require_optimizer:
+                raise ValueError(
+                    f"Checkpoint has no optimizer state: {checkpoint_path} "
+                    "(only the latest checkpoint stores it)"
+                )
 
         if self.verbose:
             epoch = checkpoint.get("epoch", "unknown")
@@ -164,13 +869,21 @@ class ModelCheckpoint:
         """
         Save configuration to JSON file.
 
+        Skips the write when the file already holds the same configuration.
+
         Args:
             config: Configuration dictionary
             filename: Filename to save to
         """
         config_path = self.save_dir / filename
+        text = json.dumps(config, indent=2)
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        if self._config_hashes.get(filename) == digest and config_path.exists():
+            return
+
         with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+            f.write(text)
+        self._config_hashes[filename] = digest
 
         if self.verbose:
             print(f"Saved config: {config_path}")
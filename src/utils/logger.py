@@ -1,10 +1,26 @@
 """MLflow logging utilities."""
 
-from typing import Any, Dict, Optional
+import queue
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 import mlflow
 import mlflow.pytorch
 import torch
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.tracking import MlflowClient
+
+# Per-request limits of the MLflow log_batch API
+_MAX_METRICS_PER_BATCH = 1000
+_MAX_PARAMS_TAGS_PER_BATCH = 100
+_MAX_ENTITIES_PER_BATCH = 1000
+
+# Queue entry that stops the background worker
+_STOP = object()
 
 
 class MLFlowLogger:
@@ -12,6 +28,15 @@ class MLFlowLogger:
     Wrapper for MLflow experiment tracking.
 
     Handles experiment creation, logging metrics, parameters, and artifacts.
+    Metrics, parameters and tags are buffered and sent with ``log_batch`` once
+    ``flush_every`` metrics are pending or ``flush_interval_s`` has passed, and
+    when the run ends; call ``flush()`` to send them sooner. The interval is
+    only checked when something is logged, so a run that goes quiet keeps its
+    buffer until the next log call, ``flush()``, ``wait()`` or ``end_run()``.
+
+    Batches and artifact uploads run on a background thread so training never
+    waits on the tracking server. ``wait()`` blocks until they are done and
+    re-raises the first error from the worker; ``end_run()`` waits too.
     """
 
     def __init__(
@@ -20,6 +45,8 @@ class MLFlowLogger:
         tracking_uri: Optional[str] = None,
         run_name: Optional[str] = None,
         tags: Optional[Dict[str, Any]] = None,
+        flush_every: int = 1000,
+        flush_interval_s: float = 5.0,
     ):
         """
         Initialize MLflow logger.
@@ -29,20 +56,42 @@ class MLFlowLogger:
             tracking_uri: MLflow tracking URI (None for local ./mlruns)
             run_name: Optional name for this run
             tags: Optional tags for the run
+            flush_every: Number of buffered metrics that triggers a flush
+            flush_interval_s: Maximum seconds between flushes, checked on
+                each log call
         """
         # Set tracking URI
         if tracking_uri is None:
             tracking_uri = "./experiments/mlruns"
         mlflow.set_tracking_uri(tracking_uri)
 
-        # Set experiment
-        mlflow.set_experiment(experiment_name)
+        # One client and a resolved experiment id, reused by every call
+        self._client = MlflowClient(tracking_uri)
+        experiment = self._client.get_experiment_by_name(experiment_name)
+        if experiment is None:
+            self._experiment_id = self._client.create_experiment(experiment_name)
+        else:
+            self._experiment_id = experiment.experiment_id
 
         self.experiment_name = experiment_name
         self.run_name = run_name
         self.tags = tags or {}
         self.run = None
 
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        self._metric_buf: List[Metric] = []
+        self._param_buf: List[Param] = []
+        self._tag_buf: List[RunTag] = []
+        # Every param logged in the current run, as MLflow only accepts a key once
+        self._params: Dict[str, str] = {}
+        self._last_flush = time.monotonic()
+
+        # Bounded, so a stalled tracking server applies back-pressure
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=10_000)
+        self._worker: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
     def start_run(self, run_name: Optional[str] = None, nested: bool = False):
         """
         Start a new MLflow run.
@@ -54,11 +103,14 @@ class MLFlowLogger:
         if run_name is None:
             run_name = self.run_name
 
-        self.run = mlflow.start_run(run_name=run_name, nested=nested)
+        # Started through the fluent API so mlflow.pytorch.log_model sees the run
+        self.run = mlflow.start_run(
+            experiment_id=self._experiment_id, run_name=run_name, nested=nested
+        )
 
         # Log tags
-        for key, value in self.tags.items():
-            mlflow.set_tag(key, value)
+        self._tag_buf.extend(RunTag(key, str(value)) for key, value in self.tags.items())
+        self.flush()
 
         return self.run
 
@@ -66,10 +118,26 @@ class MLFlowLogger:
         """
         Log parameters to MLflow.
 
+        Re-logging a parameter with the value it already has is a no-op, as
+        it was before batching; a different value raises here rather than
+        when the batch is sent.
+
         Args:
             params: Dictionary of parameters
         """
-        mlflow.log_params(params)
+        for key, value in params.items():
+            value = str(value)
+            logged = self._params.get(key)
+            if logged is None:
+                self._params[key] = value
+                self._param_buf.append(Param(key, value))
+            elif logged != value:
+                raise MlflowException(
+                    f"Changing param values is not allowed. Param with key='{key}' was "
+                    f"already logged with value='{logged}', new value='{value}'",
+                    INVALID_PARAMETER_VALUE,
+                )
+        self._maybe_flush()
 
     def log_param(self, key: str, value: Any):
         """
@@ -79,7 +147,7 @@ class MLFlowLogger:
             key: Parameter name
             value: Parameter value
         """
-        mlflow.log_param(key, value)
+        self.log_params({key: value})
 
     def log_metric(self, key: str, value: float, step: Optional[int] = None):
         """
@@ -90,7 +158,7 @@ class MLFlowLogger:
             value: Metric value
             step: Optional step number
         """
-        mlflow.log_metric(key, value, step=step)
+        self.log_metrics({key: value}, step=step)
 
     def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None):
         """
@@ -100,7 +168,91 @@ class MLFlowLogger:
             metrics: Dictionary of metrics
             step: Optional step number
         """
-        mlflow.log_metrics(metrics, step=step)
+        timestamp = int(time.time() * 1000)
+        self._metric_buf.extend(
+            Metric(key, float(value), timestamp, step or 0) for key, value in metrics.items()
+        )
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        """Flush if enough metrics are buffered or the flush interval has passed."""
+        if (
+            len(self._metric_buf) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval_s
+        ):
+            self.flush()
+
+    def flush(self):
+        """Queue all buffered metrics, parameters and tags for sending to MLflow."""
+        self._last_flush = time.monotonic()
+        if not (self._metric_buf or self._param_buf or self._tag_buf):
+            return
+
+        run_id = self._run_id()
+        metrics, params, tags = self._metric_buf, self._param_buf, self._tag_buf
+        self._metric_buf, self._param_buf, self._tag_buf = [], [], []
+        self._submit(partial(self._send_batch, run_id, metrics, params, tags))
+
+    def _run_id(self) -> str:
+        """Id of the run to log to, starting one if no run is active."""
+        if self.run is None:
+            active = mlflow.active_run()
+            if active is not None:
+                return active.info.run_id
+            self.start_run()
+        return self.run.info.run_id
+
+    def _send_batch(
+        self, run_id: str, metrics: List[Metric], params: List[Param], tags: List[RunTag]
+    ):
+        """Send entities with as few ``log_batch`` requests as the API limits allow."""
+        while metrics or params or tags:
+            batch_params = params[:_MAX_PARAMS_TAGS_PER_BATCH]
+            batch_tags = tags[:_MAX_PARAMS_TAGS_PER_BATCH]
+            n_metrics = min(
+                _MAX_METRICS_PER_BATCH,
+                _MAX_ENTITIES_PER_BATCH - len(batch_params) - len(batch_tags),
+            )
+            batch_metrics = metrics[:n_metrics]
+            self._client.log_batch(
+                run_id, metrics=batch_metrics, params=batch_params, tags=batch_tags
+            )
+            del params[: len(batch_params)], tags[: len(batch_tags)], metrics[:n_metrics]
+
+    def _submit(self, call: Callable[[], Any]):
+        """Queue a call for the background worker, starting it if needed."""
+        self._raise_worker_error()
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._drain, name="mlflow-logger", daemon=True)
+            self._worker.start()
+        self._queue.put(call)
+
+    def _drain(self):
+        """Worker loop: run queued calls until the stop sentinel arrives."""
+        while True:
+            call = self._queue.get()
+            try:
+                if call is _STOP:
+                    return
+                if self._error is None:
+                    call()
+            except BaseException as e:  # surfaced on the training thread
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_worker_error(self):
+        """Re-raise the first error hit by the background worker."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def wait(self):
+        """Flush and block until every queued MLflow call has finished."""
+        self.flush()
+        if self._worker is not None:
+            self._queue.join()
+        self._raise_worker_error()
 
     def log_artifact(self, local_path: str, artifact_path: Optional[str] = None):
         """
@@ -109,8 +261,11 @@ class MLFlowLogger:
         Args:
             local_path: Path to file or directory
             artifact_path: Optional path within artifacts directory
+
+        The upload happens in the background, so keep the file in place until
+        ``wait()`` or ``end_run()`` returns.
         """
-        mlflow.log_artifact(local_path, artifact_path)
+        self._submit(partial(self._client.log_artifact, self._run_id(), local_path, artifact_path))
 
     def log_model(
         self,
@@ -136,13 +291,21 @@ class MLFlowLogger:
             figure: Matplotlib figure
             artifact_file: Filename for saved figure
         """
-        mlflow.log_figure(figure, artifact_file)
+        self._client.log_figure(self._run_id(), figure, artifact_file)
 
     def end_run(self):
         """End the current MLflow run."""
-        if self.run is not None:
-            mlflow.end_run()
-            self.run = None
+        try:
+            self.wait()
+        finally:
+            if self._worker is not None:
+                self._queue.put(_STOP)
+                self._worker.join()
+                self._worker = None
+            if self.run is not None:
+                mlflow.end_run()
+                self.run = None
+            self._params = {}
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,166 @@
+"""Tests for BatchGame2048."""
+
+import numpy as np
+import pytest
+
+from src.game import BatchGame2048, Game2048, batch_2048, game_2048, gpu_2048
+from src.game._tables import ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE
+
+
+def test_batch_initialization():
+    """Test every game starts with two tiles."""
+    batch = BatchGame2048(n_games=8, seed=0)
+    assert batch.boards.shape == (8, 4, 4)
+    assert np.all(np.sum(batch.boards > 0, axis=(1, 2)) == 2)
+    assert np.all(batch.scores == 0)
+    assert not np.any(batch.dones)
+
+
+def test_batch_step_matches_single_game():
+    """Test a batched step moves each board like Game2048 plus one spawned tile."""
+    batch = BatchGame2048(n_games=32, seed=1)
+    rng = np.random.RandomState(1)
+
+    for _ in range(20):
+        before = batch.boards
+        actions = rng.randint(4, size=len(batch))
+        dones_before = batch.dones.copy()
+        valid = batch.get_valid_actions_batch()
+        boards, rewards, dones = batch.step(actions)
+
+        for i in range(len(batch)):
+            game = Game2048()
+            game.board = before[i]
+            game.score = 0
+            assert valid[i].tolist() == [game.is_valid_action(a) for a in range(4)]
+            if dones_before[i] or not game.is_valid_action(actions[i]):
+                assert np.array_equal(boards[i], before[i])
+                assert rewards[i] == 0
+                continue
+
+            game._move(actions[i])
+            assert rewards[i] == game.score
+            spawned = boards[i] - game.board
+            assert np.count_nonzero(spawned) == 1
+            assert spawned.max() in (2, 4)
+            assert game.board[spawned > 0] == 0
+
+            game.board = boards[i]
+            assert dones[i] == game.is_game_over()
+
+
+def test_batch_step_rejects_out_of_range_actions():
+    """Test actions outside 0-3 raise instead of moving boards backend-dependently."""
+    batch = BatchGame2048(n_games=3, seed=5)
+    before = batch.bitboards.copy()
+    for bad in (4, 7, -1):
+        with pytest.raises(ValueError):
+            batch.step(np.array([0, bad, 3]))
+    assert np.array_equal(batch.bitboards, before)
+
+
+def test_batch_plays_to_completion():
+    """Test random play finishes every game and accumulates score."""
+    batch = BatchGame2048(n_games=16, seed=2)
+    rng = np.random.RandomState(2)
+    while not np.all(batch.dones):
+        batch.step(rng.randint(4, size=len(batch)))
+
+    assert np.all(batch.scores > 0)
+    assert np.all(batch.max_tiles >= 16)
+    assert not np.any(batch.get_valid_actions_batch())
+
+
+def test_numpy_step_matches_kernel_step():
+    """Test the vectorized NumPy batch path steps boards exactly like the kernel."""
+    batch = BatchGame2048(n_games=300, seed=4)
+    rng = np.random.RandomState(4)
+    tables = (ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE)
+    boards, dones = batch.bitboards.copy(), batch.dones.copy()
+
+    for _ in range(100):
+        actions = rng.randint(4, size=len(batch))
+        draws = rng.random_sample(len(batch))
+        expected = batch_2048._valid_actions_batch(batch.bitboards, *tables)
+        assert np.array_equal(batch_2048._valid_actions_numpy(boards, *tables), expected)
+
+        rewards = batch_2048._step_batch(batch.bitboards, actions, draws, batch.dones, *tables)
+        numpy_rewards = batch_2048._step_batch_numpy(boards, actions, draws, dones, *tables)
+        assert np.array_equal(boards, batch.bitboards)
+        assert np.array_equal(numpy_rewards, rewards)
+        assert np.array_equal(dones, batch.dones)
+
+    spawned = boards.copy()
+    batch_2048._spawn_batch_numpy(spawned, draws)
+    batch_2048._spawn_batch(boards, draws)
+    assert np.array_equal(spawned, boards)
+
+
+def test_compiled_transpose_matches_python_ints():
+    """Test the shared transpose gives the same bits compiled, on arrays and on ints."""
+    boards = np.random.default_rng(6).integers(0, 2**64, size=500, dtype=np.uint64)
+    expected = np.array([game_2048._transpose(int(board)) for board in boards], dtype=np.uint64)
+
+    assert np.array_equal(batch_2048._transpose_bits(boards), expected)
+    assert all(batch_2048._transpose(board) == e for board, e in zip(boards, expected))
+
+
+def test_random_episodes_are_reproducible():
+    """Test parallel random episodes depend only on their seeds."""
+    scores, max_tiles, steps = batch_2048.run_random_episodes(np.arange(32))
+    again = batch_2048.run_random_episodes(np.arange(32)[::-1])
+
+    assert np.array_equal(scores, again[0][::-1])
+    assert np.array_equal(max_tiles, again[1][::-1])
+    assert np.all(scores > 0)
+    assert np.all(steps > 0)
+    assert np.all(max_tiles & (max_tiles - 1) == 0)  # powers of two
+
+
+def test_python_random_episodes_match_kernel():
+    """Test the Numba-free random episodes match the kernel and leave np.random alone."""
+    seeds = np.arange(8, dtype=np.int64)
+    tables = (ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE)
+    np.random.seed(123)
+    expected_draw = np.random.random_sample()
+    np.random.seed(123)
+
+    results = batch_2048._random_episodes_python(seeds, *tables)
+    assert np.random.random_sample() == expected_draw
+    for result, expected in zip(results, batch_2048._random_episodes(seeds, *tables)):
+        assert np.array_equal(result, expected)
+
+
+def test_gpu_step_matches_cpu_step():
+    """Test the CUDA kernel steps boards exactly like the CPU batch kernel."""
+    cp = pytest.importorskip("cupy")
+    try:
+        has_device = cp.cuda.runtime.getDeviceCount() > 0
+    except RuntimeError:  # CUDARuntimeError, e.g. no driver
+        has_device = False
+    if not has_device:
+        pytest.skip("No CUDA device")
+
+    batch = BatchGame2048(n_games=256, seed=3)
+    rng = np.random.RandomState(3)
+    device_boards = cp.asarray(batch.bitboards)
+    device_dones = cp.zeros(len(batch), dtype=cp.bool_)
+
+    for _ in range(50):
+        actions = rng.randint(4, size=len(batch))
+        draws = rng.random_sample(len(batch))
+        rewards = batch_2048._step_batch(
+            batch.bitboards,
+            actions,
+            draws,
+            batch.dones,
+            ROW_LEFT_TABLE,
+            ROW_RIGHT_TABLE,
+            ROW_SCORE_TABLE,
+        )
+        _, device_rewards, _ = gpu_2048.step_batch_gpu(
+            device_boards, actions.astype(np.uint8), device_dones, draws
+        )
+        assert np.array_equal(cp.asnumpy(device_boards), batch.bitboards)
+        assert np.array_equal(cp.asnumpy(device_rewards), rewards)
+        assert np.array_equal(cp.asnumpy(device_dones), batch.dones)
@@ -1,8 +1,10 @@
 """Tests for ModelCheckpoint."""
 
 import json
+import os
 from pathlib import Path
 
+import pytest
 import torch
 import torch.nn as nn
 
@@ -268,6 +270,196 @@ def test_load_with_optimizer(tmp_path):
     assert state1.keys() == state2.keys()
 
 
+def test_optimizer_state_only_in_latest(tmp_path):
+    """Test epoch and best files omit the optimizer state kept in latest."""
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False)
+
+    model = DummyModel()
+    optimizer = torch.optim.Adam(model.parameters())
+    checkpoint.save(model, epoch=1, optimizer=optimizer, metric=1.0)
+
+    assert "optimizer_state_dict" not in torch.load(save_dir / "model_epoch_1.pt")
+    assert "optimizer_state_dict" not in torch.load(save_dir / "model_best.pt")
+    assert "optimizer_state_dict" in torch.load(save_dir / "model_latest.pt")
+
+    optimizer2 = torch.optim.Adam(DummyModel().parameters())
+    checkpoint.load(DummyModel(), load_best=True, optimizer=optimizer2)
+    with pytest.raises(ValueError):
+        checkpoint.load(DummyModel(), load_best=True, optimizer=optimizer2, require_optimizer=True)
+
+
+def test_bf16_epoch_checkpoints(tmp_path):
+    """Test bf16 epoch/best files load into the model while latest stays FP32."""
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False, dtype="bf16")
+
+    model = DummyModel()
+    checkpoint.save(model, epoch=1, metric=1.0)
+
+    epoch_state = torch.load(save_dir / "model_epoch_1.pt")["model_state_dict"]
+    assert epoch_state["fc.weight"].dtype == torch.bfloat16
+    latest_state = torch.load(save_dir / "model_latest.pt")["model_state_dict"]
+    assert torch.equal(latest_state["fc.weight"], model.fc.weight)
+
+    restored = DummyModel()
+    checkpoint.load(restored, load_best=True)
+    assert restored.fc.weight.dtype == torch.float32
+    assert torch.equal(restored.fc.weight, model.fc.weight.to(torch.bfloat16).float())
+
+
+def test_sharded_checkpoints(tmp_path):
+    """Test sharded checkpoints split by module and reload through best/latest."""
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False, num_shards=2)
+
+    model = nn.Sequential(nn.Linear(10, 10), nn.ReLU(), nn.Linear(10, 5))
+    optimizer = torch.optim.Adam(model.parameters())
+    checkpoint.save(model, epoch=1, optimizer=optimizer, metric=1.0)
+
+    shards = sorted(save_dir.glob("model_epoch_1.pt.shard*.pt"))
+    assert len(shards) == 2
+    keys = [set(torch.load(path)["state"]) for path in shards]
+    assert sorted(map(sorted, keys)) == [["0.bias", "0.weight"], ["2.bias", "2.weight"]]
+
+    for load_best in (False, True):
+        restored = nn.Sequential(nn.Linear(10, 10), nn.ReLU(), nn.Linear(10, 5))
+        checkpoint.load(restored, load_best=load_best)
+        for key, value in restored.state_dict().items():
+            assert torch.equal(value, model.state_dict()[key])
+
+    # Saving the epoch again rewrites the shards the old best file refers to
+    best = save_dir / "model_best.pt"
+    checkpoint.save(model, epoch=1, metric=0.0)
+    with pytest.raises(ValueError):
+        checkpoint.load(model, checkpoint_path=str(best))
+
+
+def test_keep_last_k_epoch_files(tmp_path):
+    """Test only the newest epoch files are kept while best/latest survive."""
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False, keep_last_k=2)
+
+    model = DummyModel()
+    for epoch, metric in enumerate([5.0, 1.0, 2.0, 3.0], start=1):
+        checkpoint.save(model, epoch=epoch, metric=metric)
+
+    assert sorted(path.name for path in save_dir.glob("model_epoch_*.pt")) == [
+        "model_epoch_3.pt",
+        "model_epoch_4.pt",
+    ]
+    assert checkpoint.load(DummyModel(), load_best=True)["epoch"] == 1
+    assert checkpoint.load(DummyModel())["epoch"] == 4
+
+
+def test_keep_last_k_keeps_delta_bases(tmp_path):
+    """Test rotation keeps the files a delta or sharded best checkpoint refers to."""
+    pytest.importorskip("zstandard")
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(
+        save_dir=str(save_dir),
+        verbose=False,
+        keep_last_k=1,
+        delta_anchor_interval=3,
+        num_shards=1,
+    )
+
+    model = DummyModel()
+    for epoch, metric in enumerate([1.0, 5.0, 2.0, 3.0, 4.0, 0.0, 0.0], start=1):
+        checkpoint.save(model, epoch=epoch, metric=metric)
+        with torch.no_grad():
+            model.fc.weight.add_(1.0)
+
+    # Anchors are epochs 1, 4 and 7; best is epoch 2, a delta on anchor 1.
+    # Only anchors have shards, as delta files carry every tensor in the delta.
+    kept = sorted(path.name for path in save_dir.glob("model_epoch_*"))
+    assert kept == [
+        "model_epoch_1.pt",
+        "model_epoch_1.pt.shard0.pt",
+        "model_epoch_2.pt",
+        "model_epoch_7.pt",
+        "model_epoch_7.pt.shard0.pt",
+    ]
+    assert checkpoint.load(DummyModel(), load_best=True)["epoch"] == 2
+    assert checkpoint.load(DummyModel())["epoch"] == 7
+
+
+def test_dedup_references_identical_states(tmp_path):
+    """Test epochs with unchanged weights reference the earlier file and load back."""
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False, keep_last_k=1, dedup=True)
+
+    model = DummyModel()
+    for epoch, metric in enumerate([1.0, 5.0, 2.0, 3.0], start=1):
+        checkpoint.save(model, epoch=epoch, metric=metric)
+    first = torch.load(save_dir / "model_epoch_1.pt")
+    latest = torch.load(save_dir / "model_epoch_4.pt")
+    assert latest["model_state_dict"] == {}
+    assert latest["model_state_ref"] == {"file": "model_epoch_1.pt", "token": first["file_token"]}
+
+    # Epoch 1 holds the tensors for best (epoch 2) and latest, so it survives rotation
+    kept = sorted(path.name for path in save_dir.glob("model_epoch_*.pt"))
+    assert kept == ["model_epoch_1.pt", "model_epoch_2.pt", "model_epoch_4.pt"]
+
+    restored = DummyModel()
+    loaded = checkpoint.load(restored, load_best=True)
+    assert loaded["epoch"] == 2
+    assert "model_state_ref" not in loaded
+    assert torch.equal(restored.fc.weight, first["model_state_dict"]["fc.weight"])
+
+    with torch.no_grad():
+        model.fc.weight.add_(1.0)
+    checkpoint.save(model, epoch=5, metric=0.0)
+    assert "model_state_ref" not in torch.load(save_dir / "model_epoch_5.pt")
+    checkpoint.load(restored)
+    assert torch.equal(restored.fc.weight, model.fc.weight)
+
+
+def test_dedup_reference_detects_overwritten_target(tmp_path):
+    """Test a reference to a re-saved epoch raises instead of loading the new weights."""
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False, dedup=True)
+
+    model = DummyModel()
+    checkpoint.save(model, epoch=3, metric=1.0)
+    checkpoint.save(model, epoch=4, metric=1.0)
+    with torch.no_grad():
+        model.fc.weight.add_(1.0)
+    checkpoint.save(model, epoch=3, metric=1.0)
+
+    with pytest.raises(ValueError, match="overwritten"):
+        checkpoint.load(DummyModel(), checkpoint_path=str(save_dir / "model_epoch_4.pt"))
+
+
+def test_compressed_checkpoints(tmp_path):
+    """Test zstd-compressed checkpoints are written as .pt.zst and load back."""
+    pytest.importorskip("zstandard")
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(
+        save_dir=str(save_dir), verbose=False, compress=True, dtype="bf16", num_shards=1
+    )
+
+    model = DummyModel()
+    optimizer = torch.optim.Adam(model.parameters())
+    checkpoint.save(model, epoch=1, optimizer=optimizer, metric=1.0)
+
+    names = sorted(path.name for path in save_dir.iterdir())
+    assert names == [
+        "model_best.pt.zst",
+        "model_epoch_1.pt.zst",
+        "model_epoch_1.pt.zst.shard0.pt.zst",
+        "model_latest.pt.zst",
+    ]
+    assert (save_dir / "model_epoch_1.pt.zst").read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+
+    restored = DummyModel()
+    optimizer2 = torch.optim.Adam(restored.parameters())
+    checkpoint.load(restored, optimizer=optimizer2, require_optimizer=True)
+    assert torch.equal(restored.fc.weight, model.fc.weight)
+    checkpoint.load(restored, load_best=True)
+    assert torch.equal(restored.fc.weight, model.fc.weight.to(torch.bfloat16).float())
+
+
 def test_save_config(tmp_path):
     """Test saving configuration."""
     checkpoint = ModelCheckpoint(
@@ -295,6 +487,22 @@ def test_save_config(tmp_path):
     assert loaded_config == config
 
 
+def test_save_config_skips_unchanged(tmp_path):
+    """Test an unchanged configuration is not rewritten."""
+    checkpoint = ModelCheckpoint(save_dir=str(tmp_path / "checkpoints"), verbose=False)
+    config_path = tmp_path / "checkpoints" / "config.json"
+
+    checkpoint.save_config({"learning_rate": 0.001})
+    mtime = config_path.stat().st_mtime_ns
+    os.utime(config_path, ns=(mtime - 10**9, mtime - 10**9))
+
+    checkpoint.save_config({"learning_rate": 0.001})
+    assert config_path.stat().st_mtime_ns == mtime - 10**9
+
+    checkpoint.save_config({"learning_rate": 0.01})
+    assert checkpoint.load_config() == {"learning_rate": 0.01}
+
+
 def test_load_config(tmp_path):
     """Test loading configuration."""
     checkpoint = ModelCheckpoint(
@@ -325,3 +533,96 @@ def test_checkpoint_not_found(tmp_path):
         assert False, "Should raise FileNotFoundError"
     except FileNotFoundError as e:
         assert "Checkpoint not found" in str(e)
+
+
+def test_best_and_latest_survive_resaving_an_epoch(tmp_path):
+    """Test best/latest keep their contents when the epoch file is rewritten."""
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False)
+
+    model = DummyModel()
+    checkpoint.save(model, epoch=1, metric=10.0)
+    best_weight = model.fc.weight.detach().clone()
+
+    # Same epoch saved again with new weights and a worse metric
+    with torch.no_grad():
+        model.fc.weight.add_(1.0)
+    checkpoint.save(model, epoch=1, metric=1.0)
+
+    best = torch.load(save_dir / "model_best.pt")
+    latest = torch.load(save_dir / "model_latest.pt")
+    assert torch.equal(best["model_state_dict"]["fc.weight"], best_weight)
+    assert torch.equal(latest["model_state_dict"]["fc.weight"], model.fc.weight)
+    assert not list(save_dir.glob("*.tmp"))
+
+
+def test_async_save_snapshots_state(tmp_path):
+    """Test background saves write the state as of the save call."""
+    save_dir = tmp_path / "checkpoints"
+    model = DummyModel()
+    optimizer = torch.optim.Adam(model.parameters())
+    saved_weights = []
+
+    with ModelCheckpoint(save_dir=str(save_dir), verbose=False, async_save=True) as checkpoint:
+        for epoch in range(1, 4):
+            checkpoint.save(model, epoch=epoch, optimizer=optimizer, metric=float(epoch))
+            saved_weights.append(model.fc.weight.detach().clone())
+            # Keep training while the write is in flight
+            with torch.no_grad():
+                model.fc.weight.add_(1.0)
+
+    for epoch, weight in enumerate(saved_weights, start=1):
+        data = torch.load(save_dir / f"model_epoch_{epoch}.pt")
+        assert torch.equal(data["model_state_dict"]["fc.weight"], weight)
+    latest = torch.load(save_dir / "model_latest.pt")
+    assert latest["epoch"] == 3
+    assert "optimizer_state_dict" in latest
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+def test_cuda_state_is_staged_through_pinned_mirror(tmp_path):
+    """Test CUDA weights are saved via a reused pinned mirror."""
+    checkpoint = ModelCheckpoint(save_dir=str(tmp_path / "checkpoints"), verbose=False)
+    model = DummyModel().cuda()
+
+    checkpoint.save(model, epoch=1)
+    mirror = dict(checkpoint._pinned_mirror)
+    with torch.no_grad():
+        model.fc.weight.add_(1.0)
+    checkpoint.save(model, epoch=2)
+
+    assert all(tensor.is_pinned() for tensor in mirror.values())
+    assert all(checkpoint._pinned_mirror[key] is tensor for key, tensor in mirror.items())
+    data = torch.load(tmp_path / "checkpoints" / "model_epoch_2.pt")
+    assert torch.equal(data["model_state_dict"]["fc.weight"], model.fc.weight.cpu())
+
+
+def test_delta_checkpoints_round_trip(tmp_path):
+    """Test delta-encoded checkpoints reload to the saved weights."""
+    pytest.importorskip("zstandard")
+    save_dir = tmp_path / "checkpoints"
+    checkpoint = ModelCheckpoint(save_dir=str(save_dir), verbose=False, delta_anchor_interval=3)
+
+    model = DummyModel()
+    saved_weights = []
+    for epoch in range(1, 6):
+        checkpoint.save(model, epoch=epoch, metric=float(epoch))
+        saved_weights.append({k: v.clone() for k, v in model.state_dict().items()})
+        with torch.no_grad():
+            model.fc.weight[0, 0] += 1.0
+
+    raw = [torch.load(save_dir / f"model_epoch_{epoch}.pt") for epoch in range(1, 6)]
+    assert ["model_delta" in data for data in raw] == [False, True, True, False, True]
+
+    for epoch, weights in enumerate(saved_weights, start=1):
+        restored = DummyModel()
+        path = save_dir / f"model_epoch_{epoch}.pt"
+        data = checkpoint.load(restored, checkpoint_path=str(path))
+        assert "model_delta" not in data
+        for key, value in restored.state_dict().items():
+            assert torch.equal(value, weights[key])
+
+    # Re-saving the anchor under the same name invalidates the deltas taken from it
+    checkpoint.save(model, epoch=1, metric=0.0)
+    with pytest.raises(ValueError, match="overwritten"):
+        checkpoint.load(DummyModel(), checkpoint_path=str(save_dir / "model_epoch_2.pt"))
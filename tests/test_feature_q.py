@@ -3,6 +3,7 @@
 import numpy as np
 
 from src.agents import FeatureQAgent
+from src.utils.checkpoint import ModelCheckpoint
 
 
 def test_feature_extraction_simple():
@@ -168,3 +169,24 @@ def test_save_and_load_round_trip(tmp_path):
         loaded_agent._ensure_state(state),
         agent._ensure_state(state),
     )
+
+
+def test_load_reads_deduplicated_checkpoint(tmp_path):
+    """Loading a checkpoint that references an earlier epoch should restore the agent."""
+    checkpoint = ModelCheckpoint(
+        save_dir=str(tmp_path / "checkpoints"),
+        filename_prefix="feature_q",
+        verbose=False,
+        dedup=True,
+    )
+    agent = FeatureQAgent(seed=9)
+    state = np.arange(16, dtype=np.int32).reshape(4, 4) % 5
+    agent.learn(state, action=3, reward=5.0, next_state=state, done=True)
+    checkpoint.save(agent, epoch=1)
+    checkpoint.save(agent, epoch=2)
+
+    loaded_agent = FeatureQAgent(seed=10)
+    loaded_agent.load(str(tmp_path / "checkpoints" / "feature_q_latest.pt"))
+
+    assert loaded_agent.steps == 1
+    assert np.allclose(loaded_agent._ensure_state(state), agent._ensure_state(state))
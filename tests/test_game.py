@@ -1,8 +1,13 @@
 """Tests for Game2048 core logic."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import numpy as np
+import pytest
 
-from src.game import Action, Game2048
+from src.game import Action, BatchGame2048, Game2048, _kernels, _tables, game_2048
 
 
 def test_game_initialization():
@@ -52,6 +57,28 @@ def test_merge_line():
     assert np.array_equal(result, [4, 2, 0, 0])
 
 
+def test_merge_line_lookup_matches_reference():
+    """Test the table-backed merge agrees with the reference for every row."""
+    game = Game2048()
+    for row in range(0, 65536, 3):
+        ranks = [(row >> (4 * j)) & 0xF for j in range(4)]
+        line = np.array([1 << rank if rank else 0 for rank in ranks])
+        game.score = 0
+        expected, score = game_2048._merge_line_reference(line)
+        assert np.array_equal(game._merge_line(line), expected)
+        assert game.score == score
+
+    # Other lengths and values the tables cannot hold use the reference merge
+    rng = np.random.RandomState(5)
+    for line in [np.array([3, 3, 6, 0, 6]), np.array([1, 1, 0, 0])] + [
+        np.where(rng.random_sample(7) < 0.3, 0, 2 ** rng.randint(1, 25, 7)) for _ in range(200)
+    ]:
+        game.score = 0
+        expected, score = game_2048._merge_line_reference(line)
+        assert np.array_equal(game._merge_line(line), expected)
+        assert game.score == score
+
+
 def test_move_left():
     """Test left move."""
     game = Game2048()
@@ -78,6 +105,11 @@ def test_valid_actions():
     assert Action.UP not in valid  # Can't move up (tiles can't merge)
     assert Action.DOWN not in valid  # Can't move down (tiles can't merge)
     assert Action.RIGHT not in valid  # Can't move right (already on right edge)
+    assert game.valid_actions_mask() == 1 << Action.LEFT
+    for size in (4, 5):
+        game = Game2048(size=size)
+        assert not game.is_valid_action(-1)
+        assert not game.is_valid_action(4)
 
 
 def test_game_over():
@@ -98,11 +130,22 @@ def test_has_won():
     game = Game2048()
     assert not game.has_won()
 
-    game.board[0, 0] = 2048
     game.max_tile = 2048
     assert game.has_won()
 
 
+def test_board_is_read_only():
+    """Test writing into the decoded board raises instead of being silently lost."""
+    game = Game2048()
+    with pytest.raises(ValueError):
+        game.board[0, 0] = 2048
+
+    board = game.board.copy()
+    board[0, 0] = 2048
+    game.board = board
+    assert game.board[0, 0] == 2048
+
+
 def test_step():
     """Test step function."""
     game = Game2048(seed=42)
@@ -129,3 +172,253 @@ def test_clone():
     # Verify they're independent
     game1.step(Action.LEFT)
     assert not np.array_equal(game1.board, game2.board)
+
+
+def test_clone_continues_random_stream():
+    """Test clones spawn the same tiles as the parent from the point of cloning."""
+    for size in (4, 5):
+        game = Game2048(size=size, seed=3)
+        clone = game.clone()
+        grandchild = clone.clone()
+
+        # Advancing the parent must not affect clones that have not drawn yet
+        for action in [Action.LEFT, Action.UP, Action.RIGHT, Action.DOWN] * 3:
+            board, _, _ = game.step(action)
+            assert np.array_equal(clone.step(action)[0], board)
+            assert np.array_equal(grandchild.step(action)[0], board)
+
+
+def test_bitboard_matches_grid_backend():
+    """Test the bitboard moves agree with the NumPy grid implementation."""
+    rng = np.random.RandomState(0)
+    for _ in range(200):
+        board = np.where(rng.random_sample((4, 4)) < 0.3, 0, 2 ** rng.randint(1, 8, (4, 4)))
+        for action in Action:
+            fast = Game2048()
+            fast.board = board
+            reference = Game2048(backend="numpy")
+            reference.board = board
+
+            fast.score = reference.score = 0
+            assert fast.valid_actions_mask() == reference.valid_actions_mask()
+            assert fast.is_valid_action(action) == reference.is_valid_action(action)
+            fast._move(action)
+            reference._move(action)
+            assert np.array_equal(fast.board, reference.board)
+            assert fast.score == reference.score
+
+
+def test_bitboard_property():
+    """Test the packed bitboard round-trips with the grid and batch layouts."""
+    game = Game2048()
+    game.board = np.array([[2, 0, 0, 0], [0, 4, 0, 0], [0, 0, 0, 0], [0, 0, 0, 32768]])
+    assert game.bitboard == 1 | (2 << 20) | (15 << 60)
+
+    batch = BatchGame2048(n_games=4, seed=0)
+    for bitboard, board in zip(batch.bitboards, batch.boards):
+        game.bitboard = bitboard
+        assert np.array_equal(game.board, board)
+
+    with pytest.raises(ValueError):
+        game.bitboard = -1
+    with pytest.raises(ValueError):
+        Game2048(backend="numpy").bitboard
+
+
+def test_backend_selection():
+    """Test the backend defaults by board size and rejects invalid choices."""
+    assert Game2048().backend == "bitboard"
+    assert Game2048(size=5).backend == "numpy"
+    assert Game2048(backend="numpy").board.shape == (4, 4)
+    with pytest.raises(ValueError):
+        Game2048(size=5, backend="bitboard")
+    with pytest.raises(ValueError):
+        Game2048(backend="torch")
+
+
+def test_board_setter_rejects_invalid_tiles():
+    """Test both backends only accept powers of two."""
+    for game in (Game2048(), Game2048(size=5)):
+        with pytest.raises(ValueError):
+            game.board = np.full((game.size, game.size), 3)
+        with pytest.raises(ValueError):
+            game.board = np.zeros((3, 3))
+
+    game = Game2048(size=5)
+    board = np.zeros((5, 5), dtype=np.int64)
+    board[0, :3] = [2, 1024, 2**20]
+    game.board = board
+    assert np.array_equal(game.board, board)
+    assert game.board.dtype == np.int32
+
+
+def test_non_standard_size():
+    """Test boards other than 4x4 still play."""
+    game = Game2048(size=5, seed=0)
+    assert game.board.shape == (5, 5)
+    for action in [Action.UP, Action.LEFT, Action.DOWN, Action.RIGHT]:
+        game.step(action)
+    assert np.sum(game.board > 0) >= 2
+
+
+def test_grid_kernels_match_merge_line():
+    """Test the compiled grid kernels agree with the reference merge."""
+    game = Game2048(size=5)
+    rng = np.random.RandomState(1)
+
+    def values(ranks):
+        return np.where(ranks > 0, 2 ** ranks.astype(np.int64), 0)
+
+    for _ in range(100):
+        ranks = np.where(rng.random_sample((5, 5)) < 0.3, 0, rng.randint(1, 6, (5, 5)))
+        ranks = ranks.astype(np.int8)
+        board = values(ranks)
+
+        moved, score = _kernels.move_left(ranks)
+        game.score = 0
+        expected = np.array([game._merge_line(row) for row in board])
+        assert np.array_equal(values(moved), expected)
+        assert score == game.score
+
+        moved, _ = _kernels.move_right(ranks)
+        expected = np.array([game._merge_line(row[::-1])[::-1] for row in board])
+        assert np.array_equal(values(moved), expected)
+
+        moved, _ = _kernels.move_up(ranks)
+        expected = np.array([game._merge_line(col) for col in board.T]).T
+        assert np.array_equal(values(moved), expected)
+
+        moved, _ = _kernels.move_down(ranks)
+        expected = np.array([game._merge_line(col[::-1])[::-1] for col in board.T]).T
+        assert np.array_equal(values(moved), expected)
+
+
+def test_cython_kernels_match_numba_kernels():
+    """Test the optional Cython build agrees with the Numba/Python kernels."""
+    kernels_c = pytest.importorskip("src.game._kernels_c")
+    rng = np.random.RandomState(2)
+    for _ in range(100):
+        board = np.where(rng.random_sample((5, 5)) < 0.3, 0, rng.randint(1, 6, (5, 5)))
+        board = board.astype(np.int8)
+
+        for action in range(4):
+            moved, score = kernels_c.MOVES[action](board)
+            expected, expected_score = _kernels.MOVES[action](board)
+            assert np.array_equal(moved, expected)
+            assert score == expected_score
+            assert kernels_c.would_change(board, action) == _kernels.would_change(board, action)
+        assert kernels_c.is_game_over(board) == _kernels.is_game_over(board)
+
+        draw = rng.random_sample()
+        spawned, expected = board.copy(), board.copy()
+        assert kernels_c.add_random_tile(spawned, draw) == _kernels.add_random_tile(expected, draw)
+        assert np.array_equal(spawned, expected)
+
+
+def test_row_tables_match_merge_line():
+    """Test the precomputed row tables agree with the reference merge."""
+    for row in range(0, 65536, 7):
+        ranks = [(row >> (4 * j)) & 0xF for j in range(4)]
+        if 15 in ranks:
+            continue  # the reference has no tile cap; rank-15 rows are covered below
+        line = np.array([1 << rank if rank else 0 for rank in ranks])
+        merged, score = game_2048._merge_line_reference(line)
+        expected = [int(value).bit_length() - 1 if value else 0 for value in merged]
+        left = int(_tables.ROW_LEFT_TABLE[row])
+        assert [(left >> (4 * j)) & 0xF for j in range(4)] == expected
+        assert _tables.ROW_SCORE_TABLE[row] == score
+
+    # Two 32768 tiles do not merge
+    assert _tables.ROW_LEFT_TABLE[0xFF00] == 0x00FF
+    assert _tables.ROW_RIGHT_TABLE[0x00FF] == 0xFF00
+    assert _tables.ROW_SCORE_TABLE[0xFF00] == 0
+
+
+def test_empty_cell_mask():
+    """Test the SWAR empty-cell mask matches the decoded board."""
+    rng = np.random.RandomState(3)
+    for _ in range(200):
+        board = np.where(rng.random_sample((4, 4)) < 0.5, 0, 2 ** rng.randint(1, 16, (4, 4)))
+        game = Game2048()
+        game.board = board
+        expected = sum(1 << k for k, value in enumerate(board.ravel()) if value == 0)
+        assert game_2048._empty_cell_mask(game._bitboard) == expected
+
+
+def test_step_returns_read_only_board():
+    """Test step returns a read-only board unless a copy is requested."""
+    game = Game2048(seed=42)
+    board, _, _ = game.step(Action.UP)
+    assert not board.flags.writeable
+
+    board, _, _ = game.step(Action.LEFT, copy=True)
+    assert board.flags.writeable
+    board[0, 0] = 4096
+    assert game.board[0, 0] != 4096
+
+
+def test_snapshot_restore():
+    """Test snapshot/restore round-trips the game state."""
+    for size in (4, 5):
+        game = Game2048(size=size, seed=7)
+        game.step(Action.UP)
+        snapshot = game.snapshot()
+        board = game.board.copy()
+        score = game.score
+
+        for action in [Action.LEFT, Action.DOWN, Action.RIGHT, Action.UP] * 3:
+            game.step(action)
+
+        game.restore(snapshot)
+        assert np.array_equal(game.board, board)
+        assert game.score == score
+
+
+def test_hash_and_equality():
+    """Test games with the same board hash and compare equal."""
+    game1 = Game2048(seed=1)
+    game2 = Game2048(seed=2)
+    game2.board = game1.board
+    assert game1 == game2
+    assert hash(game1) == hash(game2)
+
+    table = {game1.clone(): 1.0}
+    assert table[game2] == 1.0
+
+    game2.step(game2.get_valid_actions()[0])
+    assert game1 != game2
+
+    grid_game = Game2048(backend="numpy")
+    grid_game.board = game1.board
+    assert grid_game == game1
+    assert hash(grid_game) == hash(game1)
+    assert table[grid_game] == 1.0
+
+
+def test_game_over_matches_valid_actions():
+    """Test the SWAR game-over check agrees with trying every move."""
+    rng = np.random.RandomState(4)
+    for _ in range(500):
+        # Few distinct ranks so full boards with and without merges are common
+        board = 2 ** rng.choice([1, 2, 3, 15], size=(4, 4))
+        if rng.random_sample() < 0.2:
+            board[rng.randint(4), rng.randint(4)] = 0
+        game = Game2048()
+        game.board = board
+        assert game.is_game_over() == (not game.get_valid_actions())
+
+
+def test_game_package_does_not_import_torch():
+    """Test the game package stays torch-free, so game tests and scripts start fast."""
+    code = "import sys, src.game; sys.exit(int('torch' in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1])
+    assert result.returncode == 0
+
+
+def test_grid_kernels_warm_up_lazily():
+    """Test importing the game package does not compile the NumPy-backend kernels."""
+    code = (
+        "import sys, src.game; from src.game import _kernels; " "sys.exit(int(_kernels._warmed_up))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1])
+    assert result.returncode == 0
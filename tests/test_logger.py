@@ -0,0 +1,73 @@
+"""Tests for MLFlowLogger."""
+
+import pytest
+from mlflow.exceptions import MlflowException
+from mlflow.tracking import MlflowClient
+
+from src.utils.logger import MLFlowLogger
+
+
+def test_metrics_are_batched_until_flush(tmp_path):
+    """Test buffered metrics and params reach the run once flushed."""
+    tracking_uri = f"sqlite:///{tmp_path / 'mlflow.db'}"
+    logger = MLFlowLogger(
+        experiment_name="test",
+        tracking_uri=tracking_uri,
+        tags={"agent": "markov"},
+        flush_every=1000,
+        flush_interval_s=3600.0,
+    )
+
+    with logger:
+        run_id = logger.run.info.run_id
+        logger.log_params({"lr": 0.1, "gamma": 0.99})
+        for step in range(1200):
+            logger.log_metrics({"score": step, "loss": 1.0 / (step + 1)}, step=step)
+
+        logger._queue.join()
+        client = MlflowClient(tracking_uri)
+        # 2400 metrics were logged; two full batches of 1000 have been flushed
+        assert (
+            len(client.get_metric_history(run_id, "score"))
+            + len(client.get_metric_history(run_id, "loss"))
+            == 2000
+        )
+
+    run = client.get_run(run_id)
+    assert run.data.params == {"lr": "0.1", "gamma": "0.99"}
+    assert run.data.tags["agent"] == "markov"
+    history = client.get_metric_history(run_id, "score")
+    assert sorted(metric.step for metric in history) == list(range(1200))
+
+
+def test_experiment_is_resolved_once_and_reused(tmp_path):
+    """Test loggers share an experiment and start a run on first flush if needed."""
+    tracking_uri = f"sqlite:///{tmp_path / 'mlflow.db'}"
+    first = MLFlowLogger(experiment_name="shared", tracking_uri=tracking_uri)
+    second = MLFlowLogger(experiment_name="shared", tracking_uri=tracking_uri)
+    assert first._experiment_id == second._experiment_id
+
+    second.log_metric("score", 1.0, step=0)
+    second.flush()
+    run_id = second.run.info.run_id
+    second.end_run()
+
+    run = MlflowClient(tracking_uri).get_run(run_id)
+    assert run.info.experiment_id == first._experiment_id
+    assert run.data.metrics == {"score": 1.0}
+
+
+def test_repeated_params_are_deduplicated(tmp_path):
+    """Test re-logging a param is a no-op and changing it raises at the call."""
+    tracking_uri = f"sqlite:///{tmp_path / 'mlflow.db'}"
+    logger = MLFlowLogger(experiment_name="params", tracking_uri=tracking_uri)
+
+    with logger:
+        run_id = logger.run.info.run_id
+        logger.log_params({"lr": 0.1, "gamma": 0.99})
+        logger.log_param("lr", 0.1)
+        with pytest.raises(MlflowException):
+            logger.log_param("lr", 0.2)
+        logger.wait()
+
+    assert MlflowClient(tracking_uri).get_run(run_id).data.params == {"lr": "0.1", "gamma": "0.99"}
@@ -122,3 +122,28 @@ def test_model_checkpoint_can_save_tabular_agent(tmp_path):
     assert loaded["epoch"] == 3
     assert restored.steps == 1
     assert np.allclose(restored._ensure_state(state), agent._ensure_state(state))
+
+
+def test_agent_loads_deduplicated_and_delta_checkpoints(tmp_path):
+    """Agent.load should resolve references and deltas written by ModelCheckpoint."""
+    checkpoint = ModelCheckpoint(
+        save_dir=str(tmp_path / "checkpoints"),
+        filename_prefix="markov_q",
+        verbose=False,
+        delta_anchor_interval=4,
+        dedup=True,
+    )
+    agent = MarkovQAgent(seed=4)
+    state = np.zeros((4, 4), dtype=np.int32)
+    agent.learn(state, action=1, reward=3.0, next_state=state, done=True)
+
+    checkpoint.save(agent, epoch=1)
+    checkpoint.save(agent, epoch=2)
+    agent.learn(state, action=2, reward=5.0, next_state=state, done=True)
+    checkpoint.save(agent, epoch=3)
+
+    for epoch, steps in ((2, 1), (3, 2)):
+        restored = MarkovQAgent(seed=8)
+        restored.load(str(tmp_path / "checkpoints" / f"markov_q_epoch_{epoch}.pt"))
+        assert restored.steps == steps
+    assert np.allclose(restored._ensure_state(state), agent._ensure_state(state))